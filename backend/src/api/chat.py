@@ -1,5 +1,5 @@
 """Chat and query endpoints."""
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.models.query import (
     ChatContextResponse,
@@ -13,23 +13,40 @@ from src.models.query import (
     SessionClearResponse,
 )
 from src.models.response import ErrorResponse, NotFoundResponse
-from src.services import get_rag_service
+from src.services import RAGService, get_rag_service
 
 router = APIRouter()
 
 
+def rag_service_dependency() -> RAGService:
+    """
+    Provide the shared RAG service to chat endpoints.
+
+    Kept separate from get_rag_service so its optional construction
+    arguments are not exposed as query parameters.
+
+    Returns:
+        RAGService instance
+    """
+    return get_rag_service()
+
+
 @router.post(
     "/chat/query",
     response_model=QueryResponse,
     responses={400: {"model": ErrorResponse}},
     tags=["chat"],
 )
-async def chat_query(request: QueryRequest) -> QueryResponse:
+async def chat_query(
+    request: QueryRequest,
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> QueryResponse:
     """
     Process a chat query using RAG pipeline.
 
     Args:
         request: Query request with question and optional context
+        rag_service: Shared RAG service (injected)
 
     Returns:
         QueryResponse with answer and sources
@@ -38,7 +55,6 @@ async def chat_query(request: QueryRequest) -> QueryResponse:
         HTTPException: If query processing fails
     """
     try:
-        rag_service = get_rag_service()
         return rag_service.query(request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -55,6 +71,7 @@ async def chat_query(request: QueryRequest) -> QueryResponse:
 async def get_chat_history(
     conversation_id: str = Query(..., description="Conversation identifier"),
     limit: int = Query(50, description="Maximum number of messages to return"),
+    rag_service: RAGService = Depends(rag_service_dependency),
 ) -> ChatHistoryResponse:
     """
     Get conversation history.
@@ -62,6 +79,7 @@ async def get_chat_history(
     Args:
         conversation_id: Conversation identifier
         limit: Maximum number of messages to return
+        rag_service: Shared RAG service (injected)
 
     Returns:
         ChatHistoryResponse with message history
@@ -69,7 +87,6 @@ async def get_chat_history(
     Raises:
         HTTPException: If conversation not found
     """
-    rag_service = get_rag_service()
     request = ChatHistoryRequest(conversation_id=conversation_id, limit=limit)
     history = rag_service.get_chat_history(request)
 
@@ -90,12 +107,14 @@ async def get_chat_history(
 )
 async def get_chat_context(
     conversation_id: str = Query(..., description="Conversation identifier"),
+    rag_service: RAGService = Depends(rag_service_dependency),
 ) -> ChatContextResponse:
     """
     Get conversation context summary.
 
     Args:
         conversation_id: Conversation identifier
+        rag_service: Shared RAG service (injected)
 
     Returns:
         ChatContextResponse with conversation summary
@@ -103,7 +122,6 @@ async def get_chat_context(
     Raises:
         HTTPException: If conversation not found
     """
-    rag_service = get_rag_service()
     context = rag_service.get_chat_context(conversation_id)
 
     if context is None:
@@ -124,12 +142,14 @@ async def clear_chat_history(
     conversation_id: str = Query(
         None, description="Specific conversation to clear, or None for all"
     ),
+    rag_service: RAGService = Depends(rag_service_dependency),
 ) -> dict:
     """
     Clear conversation history.
 
     Args:
         conversation_id: Optional specific conversation to clear
+        rag_service: Shared RAG service (injected)
 
     Returns:
         Operation result
@@ -138,7 +158,6 @@ async def clear_chat_history(
         HTTPException: If clear operation fails
     """
     try:
-        rag_service = get_rag_service()
         result = rag_service.clear_history(conversation_id)
 
         if not result.get("success", False):
@@ -160,12 +179,16 @@ async def clear_chat_history(
     responses={400: {"model": ErrorResponse}},
     tags=["chat", "session"],
 )
-async def clear_session(request: SessionClearRequest) -> SessionClearResponse:
+async def clear_session(
+    request: SessionClearRequest,
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> SessionClearResponse:
     """
     Clear session data and all associated conversations.
 
     Args:
         request: Session clear request with session_id and optional clear_all flag
+        rag_service: Shared RAG service (injected)
 
     Returns:
         SessionClearResponse with operation result
@@ -174,7 +197,6 @@ async def clear_session(request: SessionClearRequest) -> SessionClearResponse:
         HTTPException: If clear operation fails
     """
     try:
-        rag_service = get_rag_service()
         result = rag_service.clear_session(request)
         
         if not result.success:
@@ -196,12 +218,16 @@ async def clear_session(request: SessionClearRequest) -> SessionClearResponse:
     responses={404: {"model": NotFoundResponse}},
     tags=["chat", "session"],
 )
-async def get_session_info(session_id: str) -> SessionInfo:
+async def get_session_info(
+    session_id: str,
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> SessionInfo:
     """
     Get session information.
 
     Args:
         session_id: Session identifier
+        rag_service: Shared RAG service (injected)
 
     Returns:
         SessionInfo with session details
@@ -209,7 +235,6 @@ async def get_session_info(session_id: str) -> SessionInfo:
     Raises:
         HTTPException: If session not found
     """
-    rag_service = get_rag_service()
     session_info = rag_service.get_session_info(session_id)
 
     if session_info is None:
@@ -226,17 +251,20 @@ async def get_session_info(session_id: str) -> SessionInfo:
     response_model=list[ConversationInfo],
     tags=["chat", "session"],
 )
-async def list_conversations_in_session(session_id: str) -> list[ConversationInfo]:
+async def list_conversations_in_session(
+    session_id: str,
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> list[ConversationInfo]:
     """
     List all conversations in a session.
 
     Args:
         session_id: Session identifier
+        rag_service: Shared RAG service (injected)
 
     Returns:
         List of ConversationInfo objects
     """
-    rag_service = get_rag_service()
     return rag_service.list_conversations_in_session(session_id)
 
 
@@ -246,12 +274,16 @@ async def list_conversations_in_session(session_id: str) -> list[ConversationInf
     responses={404: {"model": NotFoundResponse}},
     tags=["chat", "conversation"],
 )
-async def get_conversation_info(conversation_id: str) -> ConversationInfo:
+async def get_conversation_info(
+    conversation_id: str,
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> ConversationInfo:
     """
     Get conversation information.
 
     Args:
         conversation_id: Conversation identifier
+        rag_service: Shared RAG service (injected)
 
     Returns:
         ConversationInfo with conversation details
@@ -259,7 +291,6 @@ async def get_conversation_info(conversation_id: str) -> ConversationInfo:
     Raises:
         HTTPException: If conversation not found
     """
-    rag_service = get_rag_service()
     conversation_info = rag_service.get_conversation_info(conversation_id)
 
     if conversation_info is None:
@@ -276,12 +307,16 @@ async def get_conversation_info(conversation_id: str) -> ConversationInfo:
     response_model=list[SessionInfo],
     tags=["chat", "session"],
 )
-async def list_sessions() -> list[SessionInfo]:
+async def list_sessions(
+    rag_service: RAGService = Depends(rag_service_dependency),
+) -> list[SessionInfo]:
     """
     List all active sessions.
 
+    Args:
+        rag_service: Shared RAG service (injected)
+
     Returns:
         List of SessionInfo objects
     """
-    rag_service = get_rag_service()
     return rag_service.list_sessions()
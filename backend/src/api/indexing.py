@@ -1,5 +1,5 @@
 """Repository indexing endpoints."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from src.models.index import (
     IndexClearResponse,
@@ -9,23 +9,40 @@ from src.models.index import (
     IndexStatusResponse,
 )
 from src.models.response import ErrorResponse, NotFoundResponse
-from src.services import get_indexer_service
+from src.services import IndexerService, get_indexer_service
 
 router = APIRouter()
 
 
+def indexer_service_dependency() -> IndexerService:
+    """
+    Provide the shared indexer service to indexing endpoints.
+
+    Kept separate from get_indexer_service so its optional storage_dir
+    argument is not exposed as a query parameter.
+
+    Returns:
+        IndexerService instance
+    """
+    return get_indexer_service()
+
+
 @router.post(
     "/index/start",
     response_model=IndexStartResponse,
     responses={400: {"model": ErrorResponse}},
     tags=["indexing"],
 )
-async def start_indexing(request: IndexStartRequest) -> IndexStartResponse:
+async def start_indexing(
+    request: IndexStartRequest,
+    indexer_service: IndexerService = Depends(indexer_service_dependency),
+) -> IndexStartResponse:
     """
     Start indexing a repository.
 
     Args:
         request: Index start request with repository URL
+        indexer_service: Shared indexer service (injected)
 
     Returns:
         IndexStartResponse with task ID
@@ -34,7 +51,6 @@ async def start_indexing(request: IndexStartRequest) -> IndexStartResponse:
         HTTPException: If indexing start fails
     """
     try:
-        indexer_service = get_indexer_service()
         return indexer_service.start_indexing(request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -48,12 +64,16 @@ async def start_indexing(request: IndexStartRequest) -> IndexStartResponse:
     responses={404: {"model": NotFoundResponse}},
     tags=["indexing"],
 )
-async def get_index_status(task_id: str) -> IndexStatusResponse:
+async def get_index_status(
+    task_id: str,
+    indexer_service: IndexerService = Depends(indexer_service_dependency),
+) -> IndexStatusResponse:
     """
     Get indexing task status.
 
     Args:
         task_id: Task identifier
+        indexer_service: Shared indexer service (injected)
 
     Returns:
         IndexStatusResponse with current status
@@ -61,7 +81,6 @@ async def get_index_status(task_id: str) -> IndexStatusResponse:
     Raises:
         HTTPException: If task not found
     """
-    indexer_service = get_indexer_service()
     status = indexer_service.get_indexing_status(task_id)
 
     if status is None:
@@ -76,10 +95,15 @@ async def get_index_status(task_id: str) -> IndexStatusResponse:
     responses={400: {"model": ErrorResponse}},
     tags=["indexing"],
 )
-async def clear_index() -> IndexClearResponse:
+async def clear_index(
+    indexer_service: IndexerService = Depends(indexer_service_dependency),
+) -> IndexClearResponse:
     """
     Clear the current index.
 
+    Args:
+        indexer_service: Shared indexer service (injected)
+
     Returns:
         IndexClearResponse with operation result
 
@@ -87,7 +111,6 @@ async def clear_index() -> IndexClearResponse:
         HTTPException: If clear operation fails
     """
     try:
-        indexer_service = get_indexer_service()
         result = indexer_service.clear_index()
 
         if not result.get("success", False):
@@ -113,12 +136,16 @@ async def clear_index() -> IndexClearResponse:
     response_model=IndexStats,
     tags=["indexing"],
 )
-async def get_index_stats() -> IndexStats:
+async def get_index_stats(
+    indexer_service: IndexerService = Depends(indexer_service_dependency),
+) -> IndexStats:
     """
     Get current index statistics.
 
+    Args:
+        indexer_service: Shared indexer service (injected)
+
     Returns:
         IndexStats with current index information
     """
-    indexer_service = get_indexer_service()
     return indexer_service.get_index_stats()
@@ -1,9 +1,9 @@
 """Repository endpoints."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from src.models.repository import Repository
 from src.models.response import ErrorResponse, NotFoundResponse
-from src.services import get_github_service
+from src.services import GitHubService, github_service_dependency
 
 router = APIRouter()
 
@@ -17,12 +17,16 @@ router = APIRouter()
     },
     tags=["repositories"],
 )
-async def get_repository(repo_id: str) -> Repository:
+async def get_repository(
+    repo_id: str,
+    github_service: GitHubService = Depends(github_service_dependency),
+) -> Repository:
     """
     Get repository details by repository ID (owner/name format).
 
     Args:
         repo_id: Repository identifier in format "owner/name"
+        github_service: Shared GitHub service (injected)
 
     Returns:
         Repository with full details
@@ -42,7 +46,6 @@ async def get_repository(repo_id: str) -> Repository:
                 detail=f"Repository {repo_id} not found",
             )
 
-        github_service = get_github_service()
         repo = github_service.get_repository(f"{owner}/{name}")
 
         if repo is None:
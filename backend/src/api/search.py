@@ -1,5 +1,5 @@
 """Repository search and validation endpoints."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from src.models.repository import (
     RepositorySearchRequest,
@@ -8,7 +8,7 @@ from src.models.repository import (
     RepositoryValidationResponse,
 )
 from src.models.response import ErrorResponse
-from src.services import get_github_service
+from src.services import GitHubService, github_service_dependency
 
 router = APIRouter()
 
@@ -21,12 +21,14 @@ router = APIRouter()
 )
 async def search_repositories(
     request: RepositorySearchRequest,
+    github_service: GitHubService = Depends(github_service_dependency),
 ) -> RepositorySearchResponse:
     """
     Search for GitHub repositories.
 
     Args:
         request: Search request with query and filters
+        github_service: Shared GitHub service (injected)
 
     Returns:
         RepositorySearchResponse with matching repositories
@@ -35,7 +37,6 @@ async def search_repositories(
         HTTPException: If search fails
     """
     try:
-        github_service = get_github_service()
         return github_service.search_repositories(request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -51,12 +52,14 @@ async def search_repositories(
 )
 async def validate_repository_url(
     request: RepositoryValidationRequest,
+    github_service: GitHubService = Depends(github_service_dependency),
 ) -> RepositoryValidationResponse:
     """
     Validate a GitHub repository URL.
 
     Args:
         request: Validation request with repository URL
+        github_service: Shared GitHub service (injected)
 
     Returns:
         RepositoryValidationResponse with validation result
@@ -65,7 +68,6 @@ async def validate_repository_url(
         HTTPException: If validation fails
     """
     try:
-        github_service = get_github_service()
         return github_service.validate_repository_url(request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api import chat, health, indexing, repositories, search, websocket
 from src.config import settings
@@ -52,6 +53,7 @@ app = FastAPI(
     version="0.1.0",
     description="RAG-powered GitHub repository code assistant",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
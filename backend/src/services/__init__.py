@@ -1,11 +1,16 @@
 """Services for the RAG GitHub Assistant."""
-from src.services.github_service import GitHubService, get_github_service
+from src.services.github_service import (
+    GitHubService,
+    get_github_service,
+    github_service_dependency,
+)
 from src.services.indexer_service import IndexerService, get_indexer_service
 from src.services.rag_service import RAGService, get_rag_service
 
 __all__ = [
     "GitHubService",
     "get_github_service",
+    "github_service_dependency",
     "IndexerService",
     "get_indexer_service",
     "RAGService",
@@ -238,3 +238,18 @@ def get_github_service(github_token: Optional[str] = None) -> GitHubService:
         token = github_token or settings.get_github_token()
         _github_service = GitHubService(token)
     return _github_service
+
+
+def github_service_dependency() -> GitHubService:
+    """
+    Provide the shared GitHub service to API endpoints.
+
+    Kept separate from get_github_service so its optional github_token
+    argument is not exposed as a query parameter. Search, validation and
+    repository routes all depend on this one function, so a single
+    dependency override covers every GitHub-backed endpoint.
+
+    Returns:
+        GitHubService instance
+    """
+    return get_github_service()
@@ -0,0 +1,67 @@
+"""Pooled UUID generation for request, session and task identifiers."""
+import os
+import threading
+import uuid
+import weakref
+
+
+class IdPool:
+    """Generates random (version 4) UUIDs from a prefetched entropy buffer."""
+
+    def __init__(self, batch_size: int = 256):
+        """
+        Initialize ID pool.
+
+        Args:
+            batch_size: Number of UUIDs worth of entropy to fetch per refill
+        """
+        self.batch_size = batch_size
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            # Forked workers must not replay the parent's prefetched entropy
+            ref = weakref.ref(self)
+
+            def _reset_in_child() -> None:
+                pool = ref()
+                if pool is not None:
+                    pool._reset()
+
+            os.register_at_fork(after_in_child=_reset_in_child)
+
+    def _reset(self) -> None:
+        """Drop any prefetched entropy and start with a fresh lock."""
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
+    def next(self) -> uuid.UUID:
+        """
+        Get the next random UUID.
+
+        Returns:
+            A version 4 UUID
+        """
+        with self._lock:
+            if self._pos >= len(self._buf):
+                # One os.urandom call covers the next batch_size ids
+                self._buf = os.urandom(16 * self.batch_size)
+                self._pos = 0
+            chunk = self._buf[self._pos : self._pos + 16]
+            self._pos += 16
+        return uuid.UUID(bytes=chunk, version=4)
+
+
+# Shared pool instance
+_id_pool = IdPool()
+
+
+def new_id() -> str:
+    """
+    Generate a new random identifier string.
+
+    Drop-in replacement for str(uuid.uuid4()).
+
+    Returns:
+        UUID string
+    """
+    return str(_id_pool.next())
@@ -4,7 +4,6 @@ import hashlib
 import json
 import shutil
 import subprocess
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -19,6 +18,7 @@ from src.models.index import (
     IndexStats,
     IndexStatusResponse,
 )
+from src.services.id_pool import new_id
 
 
 class IndexerService:
@@ -68,7 +68,7 @@ class IndexerService:
             )
 
         # Generate unique task ID
-        task_id = str(uuid.uuid4())
+        task_id = new_id()
 
         # Create task record
         task = {
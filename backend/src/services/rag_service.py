@@ -1,36 +1,60 @@
 """RAG (Retrieval-Augmented Generation) pipeline service."""
+import importlib.util
 import json
-import uuid
 import logging
+import re
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional
 from pathlib import Path
-import time
-
-# Set up logging
-logger = logging.getLogger(__name__)
-
-try:
-    from llama_cpp import Llama
-    LLAMA_AVAILABLE = True
-except ImportError:
-    LLAMA_AVAILABLE = False
-    logger.warning("llama-cpp-python not available. Install with: pip install llama-cpp-python")
+from typing import List, Optional
 
+from src.config import settings
 from src.models.query import (
     ChatContextResponse,
     ChatHistoryRequest,
     ChatHistoryResponse,
     ChatMessage,
+    ConversationInfo,
     QueryRequest,
     QueryResponse,
-    SourceReference,
-    SessionInfo,
-    ConversationInfo,
     SessionClearRequest,
     SessionClearResponse,
+    SessionInfo,
+    SourceReference,
 )
-from src.config import settings
+from src.services.id_pool import new_id
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# llama-cpp-python loads its native library on import, so only check that it
+# is installed here and defer the import until a model is actually loaded
+LLAMA_AVAILABLE = importlib.util.find_spec("llama_cpp") is not None
+if not LLAMA_AVAILABLE:
+    logger.warning("llama-cpp-python not available. Install with: pip install llama-cpp-python")
+
+# Bound by _get_llama() on first model load
+Llama = None
+
+
+def _get_llama():
+    """
+    Import the llama-cpp-python model class on first use.
+
+    Returns:
+        The Llama class
+    """
+    global Llama
+    if Llama is None:
+        from llama_cpp import Llama as _Llama
+
+        Llama = _Llama
+    return Llama
+
+
+# Query keywords that trigger fact-check corrections, matched in a single pass
+_FACT_CHECK_KEYWORDS = re.compile(r"embedding|model|config|default")
 
 
 class RAGService:
@@ -100,7 +124,7 @@ class RAGService:
             logger.info(f"Context: {model_config['context_length']}, Threads: {model_config['n_threads']}, Size: {model_path.stat().st_size / (1024*1024*1024):.2f} GB")
             
             # Load the model with configuration-specific settings
-            self.model = Llama(
+            self.model = _get_llama()(
                 model_path=str(model_path),
                 n_ctx=model_config["context_length"],
                 n_threads=model_config["n_threads"],
@@ -159,8 +183,8 @@ class RAGService:
             return cached_response
         
         # Generate or use provided session ID and conversation ID
-        session_id = request.session_id or str(uuid.uuid4())
-        conversation_id = request.conversation_id or str(uuid.uuid4())
+        session_id = request.session_id or new_id()
+        conversation_id = request.conversation_id or new_id()
 
         # Create session if it doesn't exist
         if session_id not in self.sessions:
@@ -811,32 +835,35 @@ Answer naturally and conversationally about what you observe in the repository.
             for file_info in files:
                 file_path = file_info.get('file_path', '')
                 language = file_info.get('language', '')
+                # Lower-case and split the path once instead of per query word
+                path_lower = file_path.lower()
+                path_parts = path_lower.split('_')
                 
                 # Calculate relevance score
                 score = 0
                 
                 # High priority: exact keyword matches in file path
                 for word in query_words:
-                    if word in file_path.lower():
+                    if word in path_lower:
                         score += 8  # Increased from 5
                 
                 # Medium priority: partial matches in file path
                 for word in query_words:
-                    if len(word) > 3 and any(word in part for part in file_path.lower().split('_')):
+                    if len(word) > 3 and any(word in part for part in path_parts):
                         score += 5  # Increased from 3
                 
                 # Boost for exact class/function name matches
                 for word in query_words:
                     if word in ['chunker', 'chunking', 'chunk', 'service']:
-                        if 'chunker' in file_path.lower():
+                        if 'chunker' in path_lower:
                             score += 10  # High boost for exact matches
                     elif word in ['embedding', 'model', 'config', 'configuration', 'transformer', 'sentence']:
-                        if any(keyword in file_path.lower() for keyword in ['config', 'chunker', 'embedding', 'vector']):
+                        if any(keyword in path_lower for keyword in ['config', 'chunker', 'embedding', 'vector']):
                             score += 12  # Very high boost for embedding-related files
-                        elif 'all-minilm' in file_path.lower() or 'sentence' in file_path.lower():
+                        elif 'all-minilm' in path_lower or 'sentence' in path_lower:
                             score += 15  # Maximum boost for specific model files
                     elif word in ['default', 'parameter', 'setting']:
-                        if any(keyword in file_path.lower() for keyword in ['config', 'chunker', 'main']):
+                        if any(keyword in path_lower for keyword in ['config', 'chunker', 'main']):
                             score += 6  # Boost for configuration files
                 
                 # Language-specific scoring
@@ -858,7 +885,7 @@ Answer naturally and conversationally about what you observe in the repository.
                 # Special file names that are often relevant
                 special_files = ['readme', 'config', 'main', 'index', 'chunker', 'indexer', 'crawler']
                 for special in special_files:
-                    if special in file_path.lower():
+                    if special in path_lower:
                         score += 2
                 
                 # Add content-based scoring if file content is available
@@ -1145,9 +1172,10 @@ Answer naturally and conversationally about what you observe in the repository.
         try:
             # Common fact-checking patterns
             corrections = []
+            triggered = set(_FACT_CHECK_KEYWORDS.findall(query.lower()))
             
             # Check for embedding model references
-            if 'embedding' in query.lower() and 'model' in query.lower():
+            if 'embedding' in triggered and 'model' in triggered:
                 # Look for actual model names in context
                 actual_models = []
                 for src in context:
@@ -1168,20 +1196,19 @@ Answer naturally and conversationally about what you observe in the repository.
                     corrections.append(f"\n\nNote: The specific model used is all-MiniLM-L6-v2 as configured in the chunker.py file.")
             
             # Check for configuration file references
-            if 'config' in query.lower():
+            if 'config' in triggered:
                 config_files = [src.file for src in context if 'config' in src.file.lower()]
                 if config_files and not any(f in response for f in config_files):
                     corrections.append(f"\n\nConfiguration is found in: {', '.join(config_files)}")
             
             # Check for default values
-            if 'default' in query.lower():
+            if 'default' in triggered:
                 # Look for default values in context
                 default_values = []
                 for src in context:
                     if hasattr(src, 'content'):
                         content = src.content
                         # Look for common default patterns
-                        import re
                         defaults = re.findall(r'default[:\s=]+["\']?([^"\'\s,]+)["\']?', content, re.IGNORECASE)
                         default_values.extend(defaults)
                 
@@ -1189,11 +1216,8 @@ Answer naturally and conversationally about what you observe in the repository.
                     unique_defaults = list(set(default_values))[:3]  # Top 3 unique defaults
                     corrections.append(f"\n\nDefault values found in source: {', '.join(unique_defaults)}")
             
-            # Add corrections to response if any found
-            if corrections:
-                response += ''.join(corrections)
-            
-            return response
+            # Add corrections to response if any found (single join, no intermediate copy)
+            return response + ''.join(corrections) if corrections else response
             
         except Exception as e:
             logger.debug(f"Error in fact-checking: {e}")
@@ -1202,6 +1226,7 @@ Answer naturally and conversationally about what you observe in the repository.
 
 # Singleton instance
 _rag_service: Optional[RAGService] = None
+_rag_service_lock = threading.Lock()
 
 
 def get_rag_service(
@@ -1220,5 +1245,8 @@ def get_rag_service(
     """
     global _rag_service
     if _rag_service is None:
-        _rag_service = RAGService(vector_store_path, model_path)
+        # Double-checked so concurrent first requests don't each build a service
+        with _rag_service_lock:
+            if _rag_service is None:
+                _rag_service = RAGService(vector_store_path, model_path)
     return _rag_service
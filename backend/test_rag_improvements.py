@@ -1,12 +1,20 @@
 """
 Test script to verify RAG improvements for endpoint detection
 """
+import orjson
 import requests
-import json
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 API_BASE = "http://localhost:8000/api"
 
+# Seconds to wait for any request; the first one can hit a cold model load
+REQUEST_TIMEOUT = 60
+
+# Shared session so consecutive calls reuse the same TCP connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 def test_endpoint_question():
     """Test the specific question about API endpoints"""
     
@@ -23,14 +31,14 @@ def test_endpoint_question():
     
     try:
         # Make request to chat API
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/chat/query",
             json={"query": question},
-            timeout=60
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Print the answer
             print("\n📝 ANSWER:")
@@ -115,14 +123,14 @@ def test_simple_question():
     print(f"\nQuestion: {question}\n")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/chat/query",
             json={"query": question},
-            timeout=60
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             answer = data.get('response') or data.get('answer', '')
             sources = data.get('sources', [])
             
@@ -139,7 +147,7 @@ if __name__ == "__main__":
     
     # Test health endpoint first
     try:
-        health = requests.get(f"{API_BASE}/health", timeout=5)
+        health = SESSION.get(f"{API_BASE}/health", timeout=REQUEST_TIMEOUT)
         if health.status_code == 200:
             print("✅ Backend server is running\n")
         else:
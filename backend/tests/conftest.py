@@ -0,0 +1,26 @@
+"""Fixtures shared by the unit, integration and end-to-end suites."""
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application under test, imported on first use."""
+    from src.main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Shared test client.
+
+    Built without entering the context manager so the app lifespan, which
+    loads the LLM, never runs. One warmup request builds the middleware
+    stack and routing caches up front, so the first test using the client
+    does not carry that cost in --durations output.
+    """
+    c = TestClient(app)
+    c.get("/api/health")
+    yield c
+    c.close()
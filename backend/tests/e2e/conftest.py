@@ -0,0 +1,267 @@
+"""Shared fixtures for end-to-end tests."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# Fixed timestamp for fake data; tests never assert on the exact value
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+# Read-only fake data shared by the workflow tests
+REPO_ATTRS = {
+    "id": "12345",
+    "name": "test-repo",
+    "full_name": "owner/test-repo",
+    "description": "A test repository",
+    "url": "https://github.com/owner/test-repo",
+    "html_url": "https://github.com/owner/test-repo",
+    "stars": 100,
+    "stargazers_count": 100,
+    "forks": 25,
+    "language": "Python",
+    "topics": ["python", "test"],
+    "owner": "owner",
+    "default_branch": "main",
+    "size": 1024,
+    "updated_at": "2023-01-01T00:00:00Z",
+    "created_at": "2022-01-01T00:00:00Z",
+}
+REPO_DETAIL_ATTRS = {
+    **REPO_ATTRS,
+    "clone_url": "https://github.com/owner/test-repo.git",
+    "ssh_url": "git@github.com:owner/test-repo.git",
+    "open_issues": 5,
+    "watchers": 50,
+    "license": "MIT",
+    "is_private": False,
+    "is_fork": False,
+    "has_wiki": True,
+    "has_issues": True,
+}
+LARGE_REPO_ATTRS = {
+    **REPO_ATTRS,
+    "name": "large-repo",
+    "full_name": "owner/large-repo",
+    "description": "A large repository",
+    "url": "https://github.com/owner/large-repo",
+    "html_url": "https://github.com/owner/large-repo",
+    "stars": 10000,
+    "stargazers_count": 10000,
+    "forks": 2500,
+    "topics": ["python", "large", "data"],
+    "size": 500000,  # Large size
+}
+SOURCE_ATTRS = {
+    "file_path": "src/main.py",
+    "start_line": 10,
+    "end_line": 25,
+    "content": "def process_data(data):\n    return data.upper()",
+    "score": 0.95,
+}
+ANSWER = (
+    "This is a Python repository with test code. "
+    "The main functionality includes data processing and analysis functions."
+)
+
+
+@pytest.fixture
+def patched_services(mocker):
+    """Patch the GitHub, indexer and RAG service getters once per test.
+
+    Returns the (github, indexer, rag) mock services for tests to configure.
+    """
+    github = mocker.patch('src.services.github_service.get_github_service').return_value
+    indexer = mocker.patch('src.api.indexing.get_indexer_service').return_value
+    rag = mocker.patch('src.api.chat.get_rag_service').return_value
+    return github, indexer, rag
+
+
+@pytest.fixture(scope="session")
+def repo_info():
+    """Repository summary as returned by search and validation."""
+    return SimpleNamespace(**REPO_ATTRS)
+
+
+@pytest.fixture(scope="session")
+def repo_detail():
+    """Full repository details as returned by get_repository."""
+    return SimpleNamespace(**REPO_DETAIL_ATTRS)
+
+
+@pytest.fixture(scope="session")
+def large_repo_info():
+    """Repository summary for a large repository."""
+    return SimpleNamespace(**LARGE_REPO_ATTRS)
+
+
+@pytest.fixture(scope="session")
+def search_response(repo_info):
+    """Search result containing the test repository."""
+    return SimpleNamespace(repositories=[repo_info], total_count=1, page=1)
+
+
+@pytest.fixture(scope="session")
+def validation_response(repo_info):
+    """Successful URL validation result."""
+    return SimpleNamespace(
+        valid=True,
+        message="Repository is valid and accessible",
+        repository_info=repo_info,
+    )
+
+
+@pytest.fixture(scope="session")
+def index_start_response():
+    """Queued indexing task."""
+    return SimpleNamespace(
+        task_id="task-123",
+        status="pending",
+        message="Indexing task created and queued",
+        repository_url="https://github.com/owner/test-repo",
+        estimated_time=300,
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="session")
+def index_status_running():
+    """Indexing task halfway through."""
+    return SimpleNamespace(
+        task_id="task-123",
+        status="running",
+        message="Indexing in progress",
+        progress=SimpleNamespace(files_processed=50, total_files=100, percentage=50.0),
+        percentage=50.0,
+        repository_url="https://github.com/owner/test-repo",
+        started_at=_NOW,
+        completed_at=None,
+        error=None,
+        result=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def index_status_completed():
+    """Finished indexing task."""
+    return SimpleNamespace(
+        task_id="task-123",
+        status="completed",
+        message="Indexing completed successfully",
+        progress=SimpleNamespace(files_processed=100, total_files=100, percentage=100.0),
+        percentage=100.0,
+        repository_url="https://github.com/owner/test-repo",
+        started_at=_NOW,
+        completed_at=_NOW,
+        error=None,
+        result=SimpleNamespace(files_indexed=100, total_size=1024000, processing_time=300.0),
+    )
+
+
+@pytest.fixture(scope="session")
+def index_stats_response():
+    """Stats for the indexed test repository."""
+    return SimpleNamespace(
+        is_indexed=True,
+        repository_name="owner/test-repo",
+        file_count=100,
+        total_size=1024000,
+        vector_count=1000,
+        last_updated=_NOW,
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="session")
+def large_index_start_response():
+    """Queued indexing task for the large repository."""
+    return SimpleNamespace(
+        task_id="task-456",
+        status="pending",
+        message="Indexing task created and queued",
+        repository_url="https://github.com/owner/large-repo",
+        estimated_time=1800,  # 30 minutes for large repo
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="session")
+def large_index_status_running():
+    """Large repository indexing task halfway through."""
+    return SimpleNamespace(
+        task_id="task-456",
+        status="running",
+        message="Indexing in progress",
+        progress=SimpleNamespace(files_processed=5000, total_files=10000, percentage=50.0),
+        percentage=50.0,
+        repository_url="https://github.com/owner/large-repo",
+        started_at=_NOW,
+        completed_at=None,
+        error=None,
+        result=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def large_index_stats_response():
+    """Stats for the indexed large repository."""
+    return SimpleNamespace(
+        is_indexed=True,
+        repository_name="owner/large-repo",
+        file_count=10000,
+        total_size=50000000,  # 50MB
+        vector_count=100000,
+        last_updated=_NOW,
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="session")
+def rag_query_response():
+    """Chat answer with a single source."""
+    return SimpleNamespace(
+        response=ANSWER,
+        sources=[SimpleNamespace(**SOURCE_ATTRS)],
+        conversation_id="conv-123",
+        confidence=0.85,
+        processing_time=1.5,
+        model_used="codellama-7b",
+    )
+
+
+@pytest.fixture(scope="session")
+def chat_history_response():
+    """Two-message conversation history."""
+    return SimpleNamespace(
+        conversation_id="conv-123",
+        messages=[
+            SimpleNamespace(
+                role="user",
+                content="What is this repository about?",
+                timestamp=_NOW,
+                sources=None,
+            ),
+            SimpleNamespace(
+                role="assistant",
+                content=ANSWER,
+                timestamp=_NOW,
+                sources=[SimpleNamespace(**SOURCE_ATTRS)],
+            ),
+        ],
+        total_messages=2,
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(scope="session")
+def chat_context_response():
+    """Summary of the two-message conversation."""
+    return SimpleNamespace(
+        conversation_id="conv-123",
+        message_count=2,
+        user_message_count=1,
+        assistant_message_count=1,
+        last_query="What is this repository about?",
+        last_response=ANSWER,
+        created_at=_NOW,
+        last_updated=_NOW,
+    )
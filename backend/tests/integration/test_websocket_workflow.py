@@ -1,13 +1,14 @@
 """Integration tests for WebSocket functionality."""
 import pytest
 import json
-import asyncio
 from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock, AsyncMock
+from unittest.mock import patch, Mock
 from datetime import datetime
 
 from src.main import app
 
+pytestmark = pytest.mark.integration
+
 
 class TestWebSocketWorkflow:
     """Integration tests for WebSocket connections and messaging."""
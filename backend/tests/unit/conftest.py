@@ -0,0 +1,94 @@
+"""Shared fixtures for unit tests."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+# Repository summary returned by search and validation
+REPO_ATTRS = {
+    "id": "12345",
+    "name": "test-repo",
+    "full_name": "owner/test-repo",
+    "description": "A test repository",
+    "url": "https://github.com/owner/test-repo",
+    "html_url": "https://github.com/owner/test-repo",
+    "stars": 100,
+    "stargazers_count": 100,
+    "forks": 25,
+    "language": "Python",
+    "topics": ["python", "test"],
+    "owner": "owner",
+    "default_branch": "main",
+    "size": 1024,
+    "updated_at": "2023-01-01T00:00:00Z",
+    "created_at": "2022-01-01T00:00:00Z",
+}
+# Full repository details returned by get_repository
+REPO_DETAIL_ATTRS = {
+    **REPO_ATTRS,
+    "clone_url": "https://github.com/owner/test-repo.git",
+    "ssh_url": "git@github.com:owner/test-repo.git",
+    "open_issues": 5,
+    "watchers": 50,
+    "license": "MIT",
+    "is_private": False,
+    "is_fork": False,
+    "has_wiki": True,
+    "has_issues": True,
+}
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session so async fixtures can be session-scoped."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def transport(app):
+    """In-process ASGI transport shared by every async client."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(transport):
+    """Shared async client over the session ASGI transport.
+
+    Redirects are followed to match TestClient behaviour.
+    """
+    async with AsyncClient(
+        transport=transport, base_url="http://test", follow_redirects=True
+    ) as c:
+        yield c
+
+
+@pytest.fixture
+def none_repo_service():
+    """GitHub service mock that finds no repositories.
+
+    get_repository returns None and searches return an empty first page;
+    tests override these per case.
+    """
+    svc = Mock()
+    svc.get_repository.return_value = None
+    svc.search_repositories.return_value = SimpleNamespace(
+        repositories=[], total_count=0, page=1
+    )
+    return svc
+
+
+@pytest.fixture(scope="session")
+def repo_info():
+    """Repository summary as returned by search and validation."""
+    return SimpleNamespace(**REPO_ATTRS)
+
+
+@pytest.fixture(scope="session")
+def repo_detail():
+    """Full repository details as returned by get_repository."""
+    return SimpleNamespace(**REPO_DETAIL_ATTRS)
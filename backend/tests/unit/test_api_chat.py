@@ -1,41 +1,133 @@
 """Unit tests for chat API endpoints."""
+import asyncio
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import orjson
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
-from datetime import datetime
 
-from src.main import app
+from src.api.chat import rag_service_dependency
+from src.api.chat import router as chat_router
+
+# Fixed timestamp for fake results; tests never assert on the exact value
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+# Large enough (~4 KB) to exercise large-body handling
+_LARGE_QUERY = "What does this function do? " * 150
+
+# Request bodies encoded once and sent with content=
+_JSON_HEADERS = {"content-type": "application/json"}
+_QUERY_BODY = orjson.dumps(
+    {"query": "What does this function do?", "conversation_id": "conv-123"}
+)
+_SIMPLE_QUERY_BODY = orjson.dumps({"query": "What does this function do?"})
+_LARGE_QUERY_BODY = orjson.dumps({"query": _LARGE_QUERY})
+
+# Prototype service results; fixtures hand out shallow copies tests may mutate
+_QUERY_RESULT_PROTOTYPE = SimpleNamespace(
+    response="Test response",
+    sources=[],
+    conversation_id="conv-123",
+    confidence=0.85,
+    processing_time=1.5,
+    model_used="codellama-7b",
+)
+_CHAT_HISTORY_PROTOTYPE = SimpleNamespace(
+    conversation_id="conv-123",
+    messages=[
+        SimpleNamespace(
+            role="user",
+            content="What does this do?",
+            timestamp=_NOW,
+            sources=None,
+        ),
+        SimpleNamespace(
+            role="assistant",
+            content="This does X",
+            timestamp=_NOW,
+            sources=[],
+        ),
+    ],
+    total_messages=2,
+    created_at=_NOW,
+)
+_CHAT_CONTEXT_PROTOTYPE = SimpleNamespace(
+    conversation_id="conv-123",
+    message_count=10,
+    user_message_count=5,
+    assistant_message_count=5,
+    last_query="What does this do?",
+    last_response="This does X",
+    created_at=_NOW,
+    last_updated=_NOW,
+)
+
+
+@pytest.fixture
+def mock_rag(app):
+    """Override the chat endpoints' RAG service dependency with a mock."""
+    m = Mock()
+    app.dependency_overrides[rag_service_dependency] = lambda: m
+    yield m
+    app.dependency_overrides.pop(rag_service_dependency, None)
+
+
+@pytest.fixture(scope="session")
+def validation_app():
+    """Bare app with only the chat router, for request validation tests.
+
+    Skips the main app's middleware and lifespan; the RAG service dependency
+    is stubbed since validation failures never reach it.
+    """
+    a = FastAPI()
+    a.include_router(chat_router, prefix="/api")
+    a.dependency_overrides[rag_service_dependency] = lambda: Mock()
+    return a
+
+
+@pytest.fixture(scope="session")
+def validation_client(validation_app):
+    """Test client for the bare validation app."""
+    with TestClient(validation_app) as c:
+        yield c
+
+
+@pytest.fixture
+def query_result():
+    """Copy of the prototype query result."""
+    return copy.copy(_QUERY_RESULT_PROTOTYPE)
+
+
+@pytest.fixture
+def chat_history():
+    """Copy of the prototype chat history."""
+    return copy.copy(_CHAT_HISTORY_PROTOTYPE)
+
+
+@pytest.fixture
+def chat_context():
+    """Copy of the prototype chat context."""
+    return copy.copy(_CHAT_CONTEXT_PROTOTYPE)
 
 
 class TestChatAPI:
     """Test cases for chat endpoints."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-    @patch('src.api.chat.get_rag_service')
-    def test_chat_query_success(self, mock_get_service):
+    def test_chat_query_success(self, client, mock_rag, query_result):
         """Test successful chat query."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.query.return_value = Mock(
-            response="This is a test response",
-            sources=[],
-            conversation_id="conv-123",
-            confidence=0.85,
-            processing_time=1.5,
-            model_used="codellama-7b"
-        )
-        mock_get_service.return_value = mock_service
+        query_result.response = "This is a test response"
+        mock_rag.query.return_value = query_result
 
         # Execute
-        response = self.client.post(
+        response = client.post(
             "/api/chat/query",
-            json={
-                "query": "What does this function do?",
-                "conversation_id": "conv-123"
-            }
+            content=_QUERY_BODY,
+            headers=_JSON_HEADERS,
         )
 
         # Verify
@@ -47,123 +139,106 @@ class TestChatAPI:
         assert data["processing_time"] == 1.5
         assert data["model_used"] == "codellama-7b"
 
-    def test_chat_query_missing_query(self):
+    def test_chat_query_missing_query(self, validation_client):
         """Test chat query with missing query."""
-        response = self.client.post(
+        response = validation_client.post(
             "/api/chat/query",
-            json={"conversation_id": "conv-123"}
+            content=b'{"conversation_id": "conv-123"}',
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
 
-    def test_chat_query_empty_query(self):
+    def test_chat_query_empty_query(self, validation_client):
         """Test chat query with empty query."""
-        response = self.client.post(
+        response = validation_client.post(
             "/api/chat/query",
-            json={"query": ""}
+            content=b'{"query": ""}',
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 422
 
-    def test_chat_query_whitespace_query(self):
+    def test_chat_query_whitespace_query(self, validation_client):
         """Test chat query with whitespace-only query."""
-        response = self.client.post(
+        response = validation_client.post(
             "/api/chat/query",
-            json={"query": "   "}
+            content=b'{"query": "   "}',
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 422
 
-    def test_chat_query_without_conversation_id(self):
+    def test_chat_query_without_conversation_id(self, client, mock_rag, query_result):
         """Test chat query without conversation ID."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="This is a test response",
-                sources=[],
-                conversation_id="conv-456",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_get_service.return_value = mock_service
+        query_result.response = "This is a test response"
+        query_result.conversation_id = "conv-456"
+        mock_rag.query.return_value = query_result
 
-            response = self.client.post(
-                "/api/chat/query",
-                json={"query": "What does this function do?"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["conversation_id"] == "conv-456"
-
-    @patch('src.api.chat.get_rag_service')
-    def test_chat_query_service_error(self, mock_get_service):
-        """Test chat query with service error."""
-        mock_service = Mock()
-        mock_service.query.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
-
-        response = self.client.post(
+        response = client.post(
             "/api/chat/query",
-            json={"query": "What does this function do?"}
+            content=_SIMPLE_QUERY_BODY,
+            headers=_JSON_HEADERS,
         )
 
-        assert response.status_code == 500
+        assert response.status_code == 200
         data = response.json()
-        assert "Query processing failed" in data["detail"]
-
-    def test_chat_query_wrong_method(self):
-        """Test chat query with wrong HTTP method."""
-        response = self.client.get("/api/chat/query")
+        assert data["conversation_id"] == "conv-456"
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("get", "/api/chat/query"),
+            ("put", "/api/chat/query"),
+            ("delete", "/api/chat/query"),
+            ("post", "/api/chat/history"),
+            ("put", "/api/chat/history"),
+            ("post", "/api/chat/context"),
+            ("put", "/api/chat/context"),
+            ("delete", "/api/chat/context"),
+        ],
+    )
+    def test_method_not_allowed(self, client, method, path):
+        """Test chat endpoints reject unsupported HTTP methods."""
+        response = getattr(client, method)(path)
         assert response.status_code == 405
 
-        response = self.client.put("/api/chat/query")
-        assert response.status_code == 405
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/chat/history",
+            "/api/chat/history?conversation_id=",
+            "/api/chat/context",
+            "/api/chat/context?conversation_id=",
+        ],
+    )
+    def test_missing_or_empty_conversation_id(self, client, path):
+        """Test history and context retrieval require a conversation ID."""
+        response = client.get(path)
 
-        response = self.client.delete("/api/chat/query")
-        assert response.status_code == 405
+        assert response.status_code == 422
+        data = response.json()
+        assert "detail" in data
 
-    def test_chat_query_invalid_json(self):
+    def test_chat_query_invalid_json(self, validation_client):
         """Test chat query with invalid JSON."""
-        response = self.client.post(
+        response = validation_client.post(
             "/api/chat/query",
-            data="invalid json",
+            content=b"invalid json",
             headers={"Content-Type": "application/json"}
         )
 
         assert response.status_code == 422
 
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_history_success(self, mock_get_service):
+    def test_get_chat_history_success(self, client, mock_rag, chat_history):
         """Test successful chat history retrieval."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.get_chat_history.return_value = Mock(
-            conversation_id="conv-123",
-            messages=[
-                Mock(
-                    role="user",
-                    content="What does this do?",
-                    timestamp=datetime.utcnow(),
-                    sources=None
-                ),
-                Mock(
-                    role="assistant",
-                    content="This does X",
-                    timestamp=datetime.utcnow(),
-                    sources=[]
-                )
-            ],
-            total_messages=2,
-            created_at=datetime.utcnow()
-        )
-        mock_get_service.return_value = mock_service
+        mock_rag.get_chat_history.return_value = chat_history
 
         # Execute
-        response = self.client.get("/api/chat/history?conversation_id=conv-123")
+        response = client.get("/api/chat/history?conversation_id=conv-123")
 
         # Verify
         assert response.status_code == 200
@@ -172,76 +247,23 @@ class TestChatAPI:
         assert len(data["messages"]) == 2
         assert data["total_messages"] == 2
 
-    def test_get_chat_history_missing_conversation_id(self):
-        """Test chat history retrieval with missing conversation ID."""
-        response = self.client.get("/api/chat/history")
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-
-    def test_get_chat_history_empty_conversation_id(self):
-        """Test chat history retrieval with empty conversation ID."""
-        response = self.client.get("/api/chat/history?conversation_id=")
-
-        assert response.status_code == 422
-
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_history_not_found(self, mock_get_service):
-        """Test chat history retrieval for non-existent conversation."""
-        mock_service = Mock()
-        mock_service.get_chat_history.return_value = None
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get("/api/chat/history?conversation_id=nonexistent")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_history_service_error(self, mock_get_service):
+    def test_get_chat_history_service_error(self, client, mock_rag):
         """Test chat history retrieval with service error."""
-        mock_service = Mock()
-        mock_service.get_chat_history.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
+        mock_rag.get_chat_history.side_effect = Exception("Service error")
 
-        response = self.client.get("/api/chat/history?conversation_id=conv-123")
+        response = client.get("/api/chat/history?conversation_id=conv-123")
 
         assert response.status_code == 500
         data = response.json()
         assert "History retrieval failed" in data["detail"]
 
-    def test_get_chat_history_wrong_method(self):
-        """Test chat history retrieval with wrong HTTP method."""
-        response = self.client.post("/api/chat/history")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/chat/history")
-        assert response.status_code == 405
-
-        response = self.client.delete("/api/chat/history")
-        assert response.status_code == 405
-
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_context_success(self, mock_get_service):
+    def test_get_chat_context_success(self, client, mock_rag, chat_context):
         """Test successful chat context retrieval."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.get_chat_context.return_value = Mock(
-            conversation_id="conv-123",
-            message_count=10,
-            user_message_count=5,
-            assistant_message_count=5,
-            last_query="What does this do?",
-            last_response="This does X",
-            created_at=datetime.utcnow(),
-            last_updated=datetime.utcnow()
-        )
-        mock_get_service.return_value = mock_service
+        mock_rag.get_chat_context.return_value = chat_context
 
         # Execute
-        response = self.client.get("/api/chat/context?conversation_id=conv-123")
+        response = client.get("/api/chat/context?conversation_id=conv-123")
 
         # Verify
         assert response.status_code == 200
@@ -253,70 +275,26 @@ class TestChatAPI:
         assert data["last_query"] == "What does this do?"
         assert data["last_response"] == "This does X"
 
-    def test_get_chat_context_missing_conversation_id(self):
-        """Test chat context retrieval with missing conversation ID."""
-        response = self.client.get("/api/chat/context")
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-
-    def test_get_chat_context_empty_conversation_id(self):
-        """Test chat context retrieval with empty conversation ID."""
-        response = self.client.get("/api/chat/context?conversation_id=")
-
-        assert response.status_code == 422
-
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_context_not_found(self, mock_get_service):
-        """Test chat context retrieval for non-existent conversation."""
-        mock_service = Mock()
-        mock_service.get_chat_context.return_value = None
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get("/api/chat/context?conversation_id=nonexistent")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    @patch('src.api.chat.get_rag_service')
-    def test_get_chat_context_service_error(self, mock_get_service):
+    def test_get_chat_context_service_error(self, client, mock_rag):
         """Test chat context retrieval with service error."""
-        mock_service = Mock()
-        mock_service.get_chat_context.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
+        mock_rag.get_chat_context.side_effect = Exception("Service error")
 
-        response = self.client.get("/api/chat/context?conversation_id=conv-123")
+        response = client.get("/api/chat/context?conversation_id=conv-123")
 
         assert response.status_code == 500
         data = response.json()
         assert "Context retrieval failed" in data["detail"]
 
-    def test_get_chat_context_wrong_method(self):
-        """Test chat context retrieval with wrong HTTP method."""
-        response = self.client.post("/api/chat/context")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/chat/context")
-        assert response.status_code == 405
-
-        response = self.client.delete("/api/chat/context")
-        assert response.status_code == 405
-
-    @patch('src.api.chat.get_rag_service')
-    def test_clear_chat_history_success(self, mock_get_service):
+    def test_clear_chat_history_success(self, client, mock_rag):
         """Test successful chat history clearing."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.clear_history.return_value = {
+        mock_rag.clear_history.return_value = {
             "success": True,
             "message": "Conversation cleared"
         }
-        mock_get_service.return_value = mock_service
 
         # Execute
-        response = self.client.delete("/api/chat/history?conversation_id=conv-123")
+        response = client.delete("/api/chat/history?conversation_id=conv-123")
 
         # Verify
         assert response.status_code == 200
@@ -324,230 +302,154 @@ class TestChatAPI:
         assert data["success"] is True
         assert "cleared" in data["message"]
 
-    @patch('src.api.chat.get_rag_service')
-    def test_clear_chat_history_all(self, mock_get_service):
+    def test_clear_chat_history_all(self, client, mock_rag):
         """Test clearing all chat history."""
-        mock_service = Mock()
-        mock_service.clear_history.return_value = {
+        mock_rag.clear_history.return_value = {
             "success": True,
             "message": "Cleared 5 conversations"
         }
-        mock_get_service.return_value = mock_service
 
-        response = self.client.delete("/api/chat/history")
+        response = client.delete("/api/chat/history")
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "Cleared" in data["message"]
 
-    @patch('src.api.chat.get_rag_service')
-    def test_clear_chat_history_failure(self, mock_get_service):
-        """Test chat history clearing failure."""
-        mock_service = Mock()
-        mock_service.clear_history.return_value = {
-            "success": False,
-            "error": "Conversation not found"
-        }
-        mock_get_service.return_value = mock_service
-
-        response = self.client.delete("/api/chat/history?conversation_id=nonexistent")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is False
-        assert "not found" in data["error"]
-
-    @patch('src.api.chat.get_rag_service')
-    def test_clear_chat_history_service_error(self, mock_get_service):
-        """Test chat history clearing with service error."""
-        mock_service = Mock()
-        mock_service.clear_history.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
-
-        response = self.client.delete("/api/chat/history?conversation_id=conv-123")
-
-        assert response.status_code == 500
-        data = response.json()
-        assert "History clearing failed" in data["detail"]
-
-    def test_clear_chat_history_wrong_method(self):
-        """Test chat history clearing with wrong HTTP method."""
-        response = self.client.get("/api/chat/history")
-        assert response.status_code == 200  # GET is allowed for history retrieval
-
-        response = self.client.post("/api/chat/history")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/chat/history")
-        assert response.status_code == 405
-
-    def test_chat_query_content_type(self):
-        """Test chat query content type."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="Test response",
-                sources=[],
-                conversation_id="conv-123",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
+    @pytest.mark.parametrize(
+        "attr,method,path,side,status,detail",
+        [
+            (
+                "query",
+                "post",
                 "/api/chat/query",
-                json={"query": "Test question"}
+                Exception("Service error"),
+                500,
+                "Query processing failed",
+            ),
+            (
+                "get_chat_history",
+                "get",
+                "/api/chat/history?conversation_id=nonexistent",
+                None,
+                404,
+                "not found",
+            ),
+            (
+                "get_chat_context",
+                "get",
+                "/api/chat/context?conversation_id=nonexistent",
+                None,
+                404,
+                "not found",
+            ),
+            (
+                "clear_history",
+                "delete",
+                "/api/chat/history?conversation_id=nonexistent",
+                {"success": False, "error": "Conversation not found"},
+                400,
+                "not found",
+            ),
+            (
+                "clear_history",
+                "delete",
+                "/api/chat/history?conversation_id=conv-123",
+                Exception("Service error"),
+                500,
+                "Failed to clear history",
+            ),
+        ],
+        ids=[
+            "query-service-error",
+            "history-not-found",
+            "context-not-found",
+            "clear-failure",
+            "clear-service-error",
+        ],
+    )
+    def test_error_paths(
+        self, client, mock_rag, attr, method, path, side, status, detail
+    ):
+        """Test chat endpoints map service failures to HTTP errors."""
+        if isinstance(side, Exception):
+            getattr(mock_rag, attr).side_effect = side
+        else:
+            getattr(mock_rag, attr).return_value = side
+
+        if method == "post":
+            response = client.post(
+                path, content=_SIMPLE_QUERY_BODY, headers=_JSON_HEADERS
             )
+        else:
+            response = getattr(client, method)(path)
 
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-
-    def test_get_chat_history_content_type(self):
-        """Test chat history retrieval content type."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.get_chat_history.return_value = None
-            mock_get_service.return_value = mock_service
-
-            response = self.client.get("/api/chat/history?conversation_id=nonexistent")
-
-            assert response.status_code == 404
-            assert response.headers["content-type"] == "application/json"
-
-    def test_get_chat_context_content_type(self):
-        """Test chat context retrieval content type."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.get_chat_context.return_value = None
-            mock_get_service.return_value = mock_service
-
-            response = self.client.get("/api/chat/context?conversation_id=nonexistent")
-
-            assert response.status_code == 404
-            assert response.headers["content-type"] == "application/json"
-
-    def test_clear_chat_history_content_type(self):
-        """Test chat history clearing content type."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.clear_history.return_value = {
-                "success": True,
-                "message": "Conversation cleared"
-            }
-            mock_get_service.return_value = mock_service
-
-            response = self.client.delete("/api/chat/history?conversation_id=conv-123")
+        assert response.status_code == status
+        data = response.json()
+        assert detail.lower() in data["detail"].lower()
+
+    @pytest.mark.asyncio
+    async def test_cors_and_content_type(self, aclient, mock_rag, query_result):
+        """Test chat endpoints return JSON with CORS headers."""
+        mock_rag.query.return_value = query_result
+        mock_rag.get_chat_history.return_value = None
+        mock_rag.get_chat_context.return_value = None
+        mock_rag.clear_history.return_value = {
+            "success": True,
+            "message": "Conversation cleared"
+        }
+        headers = {"Origin": "http://localhost:3000"}
+        post_headers = {**_JSON_HEADERS, **headers}
+
+        # Issue all four requests concurrently on the shared async client
+        responses = await asyncio.gather(
+            aclient.post(
+                "/api/chat/query", content=_SIMPLE_QUERY_BODY, headers=post_headers
+            ),
+            aclient.get("/api/chat/history?conversation_id=nonexistent", headers=headers),
+            aclient.get("/api/chat/context?conversation_id=nonexistent", headers=headers),
+            aclient.delete("/api/chat/history?conversation_id=conv-123", headers=headers),
+        )
 
-            assert response.status_code == 200
+        assert [r.status_code for r in responses] == [200, 404, 404, 200]
+        for response in responses:
             assert response.headers["content-type"] == "application/json"
+            assert "access-control-allow-origin" in response.headers
 
-    def test_cors_headers(self):
-        """Test CORS headers for all chat endpoints."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="Test response",
-                sources=[],
-                conversation_id="conv-123",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_service.get_chat_history.return_value = None
-            mock_service.get_chat_context.return_value = None
-            mock_service.clear_history.return_value = {
-                "success": True,
-                "message": "Conversation cleared"
-            }
-            mock_get_service.return_value = mock_service
-
-            # Test all endpoints
-            response1 = self.client.post(
-                "/api/chat/query",
-                json={"query": "Test question"}
-            )
-            response2 = self.client.get("/api/chat/history?conversation_id=conv-123")
-            response3 = self.client.get("/api/chat/context?conversation_id=conv-123")
-            response4 = self.client.delete("/api/chat/history?conversation_id=conv-123")
-
-            # All should have CORS headers
-            for response in [response1, response2, response3, response4]:
-                assert "access-control-allow-origin" in response.headers
-
-    def test_chat_query_large_query(self):
+    def test_chat_query_large_query(self, client, mock_rag, query_result):
         """Test chat query with large query text."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="Test response",
-                sources=[],
-                conversation_id="conv-123",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_get_service.return_value = mock_service
-
-            # Create a large query
-            large_query = "What does this function do? " * 1000
-
-            response = self.client.post(
-                "/api/chat/query",
-                json={"query": large_query}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["response"] == "Test response"
-
-    def test_chat_query_special_characters(self):
-        """Test chat query with special characters."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="Test response",
-                sources=[],
-                conversation_id="conv-123",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_get_service.return_value = mock_service
-
-            special_query = "What does this function do? @#$%^&*()_+-=[]{}|;':\",./<>?"
+        mock_rag.query.return_value = query_result
 
-            response = self.client.post(
-                "/api/chat/query",
-                json={"query": special_query}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["response"] == "Test response"
-
-    def test_chat_query_unicode_characters(self):
-        """Test chat query with unicode characters."""
-        with patch('src.api.chat.get_rag_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.query.return_value = Mock(
-                response="Test response",
-                sources=[],
-                conversation_id="conv-123",
-                confidence=0.85,
-                processing_time=1.5,
-                model_used="codellama-7b"
-            )
-            mock_get_service.return_value = mock_service
-
-            unicode_query = "What does this function do? 你好世界 🌍"
+        response = client.post(
+            "/api/chat/query",
+            content=_LARGE_QUERY_BODY,
+            headers=_JSON_HEADERS,
+        )
 
-            response = self.client.post(
-                "/api/chat/query",
-                json={"query": unicode_query}
-            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response"] == "Test response"
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            orjson.dumps(
+                {"query": "What does this function do? @#$%^&*()_+-=[]{}|;':\",./<>?"}
+            ),
+            orjson.dumps({"query": "What does this function do? 你好世界 🌍"}),
+        ],
+        ids=["special", "unicode"],
+    )
+    def test_chat_query_nonascii(self, client, mock_rag, query_result, body):
+        """Test chat query with special and unicode characters."""
+        mock_rag.query.return_value = query_result
+
+        response = client.post(
+            "/api/chat/query",
+            content=body,
+            headers=_JSON_HEADERS,
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["response"] == "Test response"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response"] == "Test response"
@@ -0,0 +1,13 @@
+"""Benchmarks for health API endpoint."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_health_check_benchmark(client, benchmark):
+    """Benchmark health check request throughput."""
+    response = benchmark.pedantic(
+        lambda: client.get("/api/health"), rounds=200, iterations=3
+    )
+
+    assert response.status_code == 200
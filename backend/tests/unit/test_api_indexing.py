@@ -1,180 +1,231 @@
 """Unit tests for indexing API endpoints."""
-import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from contextlib import contextmanager
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
-from src.main import app
+from src.api.indexing import indexer_service_dependency
+
+pytestmark = pytest.mark.asyncio
+
+# Fixed timestamp for fake results; tests never assert on the exact value
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+# Endpoint URLs and the default start request body
+_URL_START = "/api/index/start"
+_URL_STATUS = "/api/index/status/task-123"
+_URL_STATS = "/api/index/stats"
+_URL_CLEAR = "/api/index/current"
+_REPO_URL = "https://github.com/owner/test-repo"
+_DEFAULT_BODY = {"repository_url": _REPO_URL, "branch": "main"}
+
+# Allowed cross-origin caller, so responses carry CORS headers
+_ORIGIN_HEADERS = {"Origin": "http://localhost:3000"}
+
+# Unsupported methods for each indexing endpoint
+_WRONG_METHODS = (
+    [(_URL_START, m) for m in ("get", "put", "delete")]
+    + [(_URL_STATUS, m) for m in ("post", "put", "delete")]
+    + [(_URL_STATS, m) for m in ("post", "put", "delete")]
+    + [(_URL_CLEAR, m) for m in ("get", "post", "put")]
+)
+
+
+@contextmanager
+def _override_indexer_service(app, service):
+    """Serve the given object as the app's indexer service inside the block.
+
+    Any override already in place is restored on exit.
+    """
+    overrides = app.dependency_overrides
+    previous = overrides.get(indexer_service_dependency)
+    overrides[indexer_service_dependency] = lambda: service
+    try:
+        yield service
+    finally:
+        if previous is None:
+            overrides.pop(indexer_service_dependency, None)
+        else:
+            overrides[indexer_service_dependency] = previous
+
+
+@pytest.fixture(scope="module")
+def mock_service(app):
+    """Override the indexing endpoints' service dependency with a mock."""
+    with _override_indexer_service(app, Mock()) as m:
+        yield m
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_service(mock_service):
+    """Clear calls, return values and side effects left by the previous test."""
+    mock_service.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def start_indexing_response():
+    """Queued indexing task returned by start_indexing."""
+    return SimpleNamespace(
+        task_id="task-123",
+        status="pending",
+        message="Indexing task created and queued",
+        repository_url=_REPO_URL,
+        estimated_time=300,
+        created_at=_NOW
+    )
+
+
+@pytest.fixture(scope="session")
+def status_response_running():
+    """Indexing task halfway through."""
+    return SimpleNamespace(
+        task_id="task-123",
+        status="running",
+        message="Indexing in progress",
+        progress=SimpleNamespace(
+            files_processed=50,
+            total_files=100,
+            percentage=50.0
+        ),
+        percentage=50.0,
+        repository_url=_REPO_URL,
+        started_at=_NOW,
+        completed_at=None,
+        error=None,
+        result=None
+    )
+
+
+@pytest.fixture(scope="session")
+def stats_response_indexed():
+    """Stats for an indexed repository."""
+    return SimpleNamespace(
+        is_indexed=True,
+        repository_name="owner/test-repo",
+        file_count=100,
+        total_size=1024000,
+        vector_count=1000,
+        last_updated=_NOW,
+        created_at=_NOW
+    )
+
+
+@pytest.fixture(scope="session")
+def stats_response_empty():
+    """Stats when nothing has been indexed."""
+    return SimpleNamespace(
+        is_indexed=False,
+        repository_name=None,
+        file_count=0,
+        total_size=0,
+        vector_count=0,
+        last_updated=None,
+        created_at=None
+    )
+
+
+@pytest.fixture(scope="session")
+def clear_success_response():
+    """Successful clear_index result."""
+    return {
+        "success": True,
+        "files_removed": 5,
+        "space_freed": 1024000,
+        "message": "Index cleared successfully"
+    }
 
 
 class TestIndexingAPI:
     """Test cases for indexing endpoints."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-    @patch('src.api.indexing.get_indexer_service')
-    def test_start_indexing_success(self, mock_get_service):
+    async def test_start_indexing_success(
+        self, aclient, mock_service, start_indexing_response
+    ):
         """Test successful indexing start."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.start_indexing.return_value = Mock(
-            task_id="task-123",
-            status="pending",
-            message="Indexing task created and queued",
-            repository_url="https://github.com/owner/test-repo",
-            estimated_time=300,
-            created_at=datetime.utcnow()
-        )
-        mock_get_service.return_value = mock_service
+        mock_service.start_indexing.return_value = start_indexing_response
 
         # Execute
-        response = self.client.post(
-            "/api/index/start",
-            json={
-                "repository_url": "https://github.com/owner/test-repo",
-                "branch": "main"
-            }
+        response = await aclient.post(
+            _URL_START, json=_DEFAULT_BODY, headers=_ORIGIN_HEADERS
         )
 
         # Verify
         assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
         data = response.json()
         assert data["task_id"] == "task-123"
         assert data["status"] == "pending"
-        assert data["repository_url"] == "https://github.com/owner/test-repo"
+        assert data["repository_url"] == _REPO_URL
         assert data["estimated_time"] == 300
 
-    def test_start_indexing_missing_repository_url(self):
-        """Test indexing start with missing repository URL."""
-        response = self.client.post(
-            "/api/index/start",
-            json={"branch": "main"}
-        )
+    @pytest.mark.parametrize(
+        "payload,raw",
+        [
+            ({"branch": "main"}, False),
+            ({"repository_url": "not-a-url"}, False),
+            ({"repository_url": ""}, False),
+            ({"repository_url": _REPO_URL, "branch": ""}, False),
+            ("invalid json", True),
+        ],
+        ids=[
+            "missing-url",
+            "invalid-url",
+            "empty-url",
+            "empty-branch",
+            "invalid-json",
+        ],
+    )
+    async def test_start_indexing_validation_errors(self, aclient, payload, raw):
+        """Test indexing start rejects invalid request bodies."""
+        if raw:
+            response = await aclient.post(
+                _URL_START,
+                content=payload,
+                headers={"Content-Type": "application/json"}
+            )
+        else:
+            response = await aclient.post(_URL_START, json=payload)
 
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
 
-    def test_start_indexing_invalid_repository_url(self):
-        """Test indexing start with invalid repository URL."""
-        response = self.client.post(
-            "/api/index/start",
-            json={"repository_url": "not-a-url"}
-        )
-
-        assert response.status_code == 422
-
-    def test_start_indexing_empty_repository_url(self):
-        """Test indexing start with empty repository URL."""
-        response = self.client.post(
-            "/api/index/start",
-            json={"repository_url": ""}
-        )
-
-        assert response.status_code == 422
-
-    def test_start_indexing_default_branch(self):
+    async def test_start_indexing_default_branch(
+        self, aclient, mock_service, start_indexing_response
+    ):
         """Test indexing start with default branch."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.start_indexing.return_value = Mock(
-                task_id="task-123",
-                status="pending",
-                message="Indexing task created and queued",
-                repository_url="https://github.com/owner/test-repo",
-                estimated_time=300,
-                created_at=datetime.utcnow()
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/index/start",
-                json={"repository_url": "https://github.com/owner/test-repo"}
-            )
+        mock_service.start_indexing.return_value = start_indexing_response
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["task_id"] == "task-123"
-
-    def test_start_indexing_invalid_branch(self):
-        """Test indexing start with invalid branch."""
-        response = self.client.post(
-            "/api/index/start",
-            json={
-                "repository_url": "https://github.com/owner/test-repo",
-                "branch": ""
-            }
-        )
+        response = await aclient.post(_URL_START, json={"repository_url": _REPO_URL})
 
-        assert response.status_code == 422
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task_id"] == "task-123"
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_start_indexing_service_error(self, mock_get_service):
+    async def test_start_indexing_service_error(self, app, aclient):
         """Test indexing start with service error."""
-        mock_service = Mock()
-        mock_service.start_indexing.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
-
-        response = self.client.post(
-            "/api/index/start",
-            json={
-                "repository_url": "https://github.com/owner/test-repo",
-                "branch": "main"
-            }
-        )
+        service = Mock()
+        service.start_indexing.side_effect = Exception("Service error")
+
+        with _override_indexer_service(app, service):
+            response = await aclient.post(_URL_START, json=_DEFAULT_BODY)
 
         assert response.status_code == 500
         data = response.json()
         assert "Failed to start indexing" in data["detail"]
 
-    def test_start_indexing_wrong_method(self):
-        """Test indexing start with wrong HTTP method."""
-        response = self.client.get("/api/index/start")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/index/start")
-        assert response.status_code == 405
-
-        response = self.client.delete("/api/index/start")
-        assert response.status_code == 405
-
-    def test_start_indexing_invalid_json(self):
-        """Test indexing start with invalid JSON."""
-        response = self.client.post(
-            "/api/index/start",
-            data="invalid json",
-            headers={"Content-Type": "application/json"}
-        )
-
-        assert response.status_code == 422
-
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_status_success(self, mock_get_service):
+    async def test_get_index_status_success(
+        self, aclient, mock_service, status_response_running
+    ):
         """Test successful index status retrieval."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.get_indexing_status.return_value = Mock(
-            task_id="task-123",
-            status="running",
-            message="Indexing in progress",
-            progress=Mock(
-                files_processed=50,
-                total_files=100,
-                percentage=50.0
-            ),
-            percentage=50.0,
-            repository_url="https://github.com/owner/test-repo",
-            started_at=datetime.utcnow(),
-            completed_at=None,
-            error=None,
-            result=None
-        )
-        mock_get_service.return_value = mock_service
+        mock_service.get_indexing_status.return_value = status_response_running
 
         # Execute
-        response = self.client.get("/api/index/status/task-123")
+        response = await aclient.get(_URL_STATUS)
 
         # Verify
         assert response.status_code == 200
@@ -182,69 +233,42 @@ class TestIndexingAPI:
         assert data["task_id"] == "task-123"
         assert data["status"] == "running"
         assert data["percentage"] == 50.0
-        assert data["repository_url"] == "https://github.com/owner/test-repo"
+        assert data["repository_url"] == _REPO_URL
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_status_not_found(self, mock_get_service):
+    async def test_get_index_status_not_found(self, aclient, mock_service):
         """Test index status retrieval for non-existent task."""
-        mock_service = Mock()
         mock_service.get_indexing_status.return_value = None
-        mock_get_service.return_value = mock_service
 
-        response = self.client.get("/api/index/status/nonexistent-task")
+        response = await aclient.get(
+            "/api/index/status/nonexistent-task", headers=_ORIGIN_HEADERS
+        )
 
         assert response.status_code == 404
+        assert "access-control-allow-origin" in response.headers
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_get_index_status_invalid_task_id(self):
-        """Test index status retrieval with invalid task ID."""
-        response = self.client.get("/api/index/status/")
-
-        assert response.status_code == 404
-
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_status_service_error(self, mock_get_service):
+    async def test_get_index_status_service_error(self, app, aclient):
         """Test index status retrieval with service error."""
-        mock_service = Mock()
-        mock_service.get_indexing_status.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
+        service = Mock()
+        service.get_indexing_status.side_effect = Exception("Service error")
 
-        response = self.client.get("/api/index/status/task-123")
+        with _override_indexer_service(app, service):
+            response = await aclient.get(_URL_STATUS)
 
         assert response.status_code == 500
         data = response.json()
         assert "Status retrieval failed" in data["detail"]
 
-    def test_get_index_status_wrong_method(self):
-        """Test index status retrieval with wrong HTTP method."""
-        response = self.client.post("/api/index/status/task-123")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/index/status/task-123")
-        assert response.status_code == 405
-
-        response = self.client.delete("/api/index/status/task-123")
-        assert response.status_code == 405
-
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_stats_success(self, mock_get_service):
+    async def test_get_index_stats_success(
+        self, aclient, mock_service, stats_response_indexed
+    ):
         """Test successful index stats retrieval."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.get_index_stats.return_value = Mock(
-            is_indexed=True,
-            repository_name="owner/test-repo",
-            file_count=100,
-            total_size=1024000,
-            vector_count=1000,
-            last_updated=datetime.utcnow(),
-            created_at=datetime.utcnow()
-        )
-        mock_get_service.return_value = mock_service
+        mock_service.get_index_stats.return_value = stats_response_indexed
 
         # Execute
-        response = self.client.get("/api/index/stats")
+        response = await aclient.get(_URL_STATS)
 
         # Verify
         assert response.status_code == 200
@@ -255,229 +279,113 @@ class TestIndexingAPI:
         assert data["total_size"] == 1024000
         assert data["vector_count"] == 1000
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_stats_not_indexed(self, mock_get_service):
+    async def test_get_index_stats_not_indexed(
+        self, aclient, mock_service, stats_response_empty
+    ):
         """Test index stats retrieval when not indexed."""
-        mock_service = Mock()
-        mock_service.get_index_stats.return_value = Mock(
-            is_indexed=False,
-            repository_name=None,
-            file_count=0,
-            total_size=0,
-            vector_count=0,
-            last_updated=None,
-            created_at=None
-        )
-        mock_get_service.return_value = mock_service
+        mock_service.get_index_stats.return_value = stats_response_empty
 
-        response = self.client.get("/api/index/stats")
+        response = await aclient.get(_URL_STATS, headers=_ORIGIN_HEADERS)
 
         assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
         data = response.json()
         assert data["is_indexed"] is False
         assert data["repository_name"] is None
         assert data["file_count"] == 0
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_get_index_stats_service_error(self, mock_get_service):
+    async def test_get_index_stats_service_error(self, app, aclient):
         """Test index stats retrieval with service error."""
-        mock_service = Mock()
-        mock_service.get_index_stats.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
+        service = Mock()
+        service.get_index_stats.side_effect = Exception("Service error")
 
-        response = self.client.get("/api/index/stats")
+        with _override_indexer_service(app, service):
+            response = await aclient.get(_URL_STATS)
 
         assert response.status_code == 500
         data = response.json()
         assert "Stats retrieval failed" in data["detail"]
 
-    def test_get_index_stats_wrong_method(self):
-        """Test index stats retrieval with wrong HTTP method."""
-        response = self.client.post("/api/index/stats")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/index/stats")
-        assert response.status_code == 405
-
-        response = self.client.delete("/api/index/stats")
-        assert response.status_code == 405
-
-    @patch('src.api.indexing.get_indexer_service')
-    def test_clear_index_success(self, mock_get_service):
+    async def test_clear_index_success(
+        self, aclient, mock_service, clear_success_response
+    ):
         """Test successful index clearing."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.clear_index.return_value = {
-            "success": True,
-            "files_removed": 5,
-            "space_freed": 1024000,
-            "message": "Index cleared successfully"
-        }
-        mock_get_service.return_value = mock_service
+        mock_service.clear_index.return_value = clear_success_response
 
         # Execute
-        response = self.client.delete("/api/index/current")
+        response = await aclient.delete(_URL_CLEAR, headers=_ORIGIN_HEADERS)
 
         # Verify
         assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
         data = response.json()
         assert data["success"] is True
         assert data["files_removed"] == 5
         assert data["space_freed"] == 1024000
         assert "cleared successfully" in data["message"]
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_clear_index_failure(self, mock_get_service):
+    async def test_clear_index_failure(self, aclient, mock_service):
         """Test index clearing failure."""
-        mock_service = Mock()
         mock_service.clear_index.return_value = {
             "success": False,
             "error": "Permission denied",
             "message": "Failed to clear index"
         }
-        mock_get_service.return_value = mock_service
 
-        response = self.client.delete("/api/index/current")
+        response = await aclient.delete(_URL_CLEAR)
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is False
         assert "Failed to clear" in data["message"]
 
-    @patch('src.api.indexing.get_indexer_service')
-    def test_clear_index_service_error(self, mock_get_service):
+    async def test_clear_index_service_error(self, app, aclient):
         """Test index clearing with service error."""
-        mock_service = Mock()
-        mock_service.clear_index.side_effect = Exception("Service error")
-        mock_get_service.return_value = mock_service
+        service = Mock()
+        service.clear_index.side_effect = Exception("Service error")
 
-        response = self.client.delete("/api/index/current")
+        with _override_indexer_service(app, service):
+            response = await aclient.delete(_URL_CLEAR)
 
         assert response.status_code == 500
         data = response.json()
         assert "Index clearing failed" in data["detail"]
 
-    def test_clear_index_wrong_method(self):
-        """Test index clearing with wrong HTTP method."""
-        response = self.client.get("/api/index/current")
-        assert response.status_code == 405
-
-        response = self.client.post("/api/index/current")
-        assert response.status_code == 405
-
-        response = self.client.put("/api/index/current")
+    @pytest.mark.parametrize("path,method", _WRONG_METHODS)
+    async def test_method_not_allowed(self, aclient, path, method):
+        """Test indexing endpoints reject unsupported HTTP methods."""
+        response = await aclient.request(method, path)
         assert response.status_code == 405
 
-    def test_start_indexing_content_type(self):
-        """Test indexing start content type."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.start_indexing.return_value = Mock(
-                task_id="task-123",
-                status="pending",
-                message="Indexing task created and queued",
-                repository_url="https://github.com/owner/test-repo",
-                estimated_time=300,
-                created_at=datetime.utcnow()
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/index/start",
-                json={"repository_url": "https://github.com/owner/test-repo"}
-            )
+    @pytest.mark.parametrize(
+        "method,path,body,code",
+        [
+            ("post", _URL_START, {"repository_url": _REPO_URL}, 200),
+            ("get", _URL_STATUS, None, 404),
+            ("get", _URL_STATS, None, 200),
+            ("delete", _URL_CLEAR, None, 200),
+        ],
+    )
+    async def test_content_type(
+        self,
+        aclient,
+        mock_service,
+        start_indexing_response,
+        stats_response_empty,
+        clear_success_response,
+        method,
+        path,
+        body,
+        code,
+    ):
+        """Test indexing endpoints respond with JSON."""
+        mock_service.start_indexing.return_value = start_indexing_response
+        mock_service.get_indexing_status.return_value = None
+        mock_service.get_index_stats.return_value = stats_response_empty
+        mock_service.clear_index.return_value = clear_success_response
 
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-
-    def test_get_index_status_content_type(self):
-        """Test index status retrieval content type."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.get_indexing_status.return_value = None
-            mock_get_service.return_value = mock_service
-
-            response = self.client.get("/api/index/status/task-123")
-
-            assert response.status_code == 404
-            assert response.headers["content-type"] == "application/json"
-
-    def test_get_index_stats_content_type(self):
-        """Test index stats retrieval content type."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.get_index_stats.return_value = Mock(
-                is_indexed=False,
-                repository_name=None,
-                file_count=0,
-                total_size=0,
-                vector_count=0,
-                last_updated=None,
-                created_at=None
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.get("/api/index/stats")
-
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-
-    def test_clear_index_content_type(self):
-        """Test index clearing content type."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.clear_index.return_value = {
-                "success": True,
-                "files_removed": 0,
-                "space_freed": 0,
-                "message": "Index cleared successfully"
-            }
-            mock_get_service.return_value = mock_service
-
-            response = self.client.delete("/api/index/current")
-
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-
-    def test_cors_headers(self):
-        """Test CORS headers for all indexing endpoints."""
-        with patch('src.api.indexing.get_indexer_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.start_indexing.return_value = Mock(
-                task_id="task-123",
-                status="pending",
-                message="Indexing task created and queued",
-                repository_url="https://github.com/owner/test-repo",
-                estimated_time=300,
-                created_at=datetime.utcnow()
-            )
-            mock_service.get_indexing_status.return_value = None
-            mock_service.get_index_stats.return_value = Mock(
-                is_indexed=False,
-                repository_name=None,
-                file_count=0,
-                total_size=0,
-                vector_count=0,
-                last_updated=None,
-                created_at=None
-            )
-            mock_service.clear_index.return_value = {
-                "success": True,
-                "files_removed": 0,
-                "space_freed": 0,
-                "message": "Index cleared successfully"
-            }
-            mock_get_service.return_value = mock_service
-
-            # Test all endpoints
-            response1 = self.client.post(
-                "/api/index/start",
-                json={"repository_url": "https://github.com/owner/test-repo"}
-            )
-            response2 = self.client.get("/api/index/status/task-123")
-            response3 = self.client.get("/api/index/stats")
-            response4 = self.client.delete("/api/index/current")
+        response = await aclient.request(method, path, json=body)
 
-            # All should have CORS headers
-            for response in [response1, response2, response3, response4]:
-                assert "access-control-allow-origin" in response.headers
+        assert response.status_code == code
+        assert response.headers["content-type"] == "application/json"
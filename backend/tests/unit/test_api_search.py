@@ -1,71 +1,65 @@
 """Unit tests for search API endpoints."""
+import asyncio
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
-import json
 
-from src.main import app
+from src.services import github_service_dependency
+
+# Request bodies encoded once and sent with content=
+_JSON_HEADERS = {"content-type": "application/json"}
+_SEARCH_PYTHON = orjson.dumps({"query": "python", "limit": 10})
+_SEARCH_DEFAULT = orjson.dumps({"query": "python"})
+_VALIDATE_OK = orjson.dumps({"url": "https://github.com/owner/test-repo"})
+
+
+@pytest.fixture(autouse=True)
+def mock_gh(app, none_repo_service):
+    """Install the empty GitHub service mock as the endpoints' dependency."""
+    app.dependency_overrides[github_service_dependency] = lambda: none_repo_service
+    yield none_repo_service
+    app.dependency_overrides.pop(github_service_dependency, None)
+
+
+@pytest.fixture(scope="session")
+def large_repos(repo_info):
+    """One hundred distinct repository summaries, built once per session."""
+    return [
+        SimpleNamespace(**{
+            **vars(repo_info),
+            "id": str(i),
+            "name": f"repo-{i}",
+            "full_name": f"owner/repo-{i}",
+            "description": f"Description {i}",
+            "url": f"https://github.com/owner/repo-{i}",
+            "html_url": f"https://github.com/owner/repo-{i}",
+            "stars": i * 10,
+            "stargazers_count": i * 10,
+            "forks": i * 2,
+            "topics": [],
+        })
+        for i in range(100)
+    ]
 
 
 class TestSearchAPI:
     """Test cases for search endpoints."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-    @patch('src.api.search.get_github_service')
-    def test_search_repositories_success(self, mock_get_service):
+    def test_search_repositories_success(self, client, mock_gh, repo_info):
         """Test successful repository search."""
         # Setup mock
-        mock_service = Mock()
-        mock_repo = Mock()
-        mock_repo.id = "12345"
-        mock_repo.name = "test-repo"
-        mock_repo.full_name = "owner/test-repo"
-        mock_repo.description = "A test repository"
-        mock_repo.html_url = "https://github.com/owner/test-repo"
-        mock_repo.stargazers_count = 100
-        mock_repo.forks_count = 25
-        mock_repo.language = "Python"
-        mock_repo.owner.login = "owner"
-        mock_repo.default_branch = "main"
-        mock_repo.size = 1024
-        mock_repo.updated_at = "2023-01-01T00:00:00Z"
-        mock_repo.created_at = "2022-01-01T00:00:00Z"
-        mock_repo.get_topics.return_value = ["python", "test"]
-        
-        mock_search_result = Mock()
-        mock_search_result.totalCount = 1
-        mock_search_result.__iter__ = Mock(return_value=iter([mock_repo]))
-        mock_service.search_repositories.return_value = Mock(
-            repositories=[Mock(
-                id="12345",
-                name="test-repo",
-                full_name="owner/test-repo",
-                description="A test repository",
-                url="https://github.com/owner/test-repo",
-                html_url="https://github.com/owner/test-repo",
-                stars=100,
-                stargazers_count=100,
-                forks=25,
-                language="Python",
-                topics=["python", "test"],
-                owner="owner",
-                default_branch="main",
-                size=1024,
-                updated_at="2023-01-01T00:00:00Z",
-                created_at="2022-01-01T00:00:00Z"
-            )],
+        mock_gh.search_repositories.return_value = SimpleNamespace(
+            repositories=[repo_info],
             total_count=1,
             page=1
         )
-        mock_get_service.return_value = mock_service
 
         # Execute
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
-            json={"query": "python test", "limit": 10}
+            content=_SEARCH_PYTHON,
+            headers=_JSON_HEADERS
         )
 
         # Verify
@@ -78,83 +72,70 @@ class TestSearchAPI:
         assert data["repositories"][0]["name"] == "test-repo"
         assert data["total_count"] == 1
 
-    def test_search_repositories_missing_query(self):
+    def test_search_repositories_missing_query(self, client):
         """Test repository search with missing query."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             json={"limit": 10}
         )
 
         assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
+        assert "detail" in response.json()
 
-    def test_search_repositories_invalid_query(self):
+    def test_search_repositories_invalid_query(self, client):
         """Test repository search with invalid query."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             json={"query": "", "limit": 10}
         )
 
         assert response.status_code == 422
 
-    def test_search_repositories_invalid_limit(self):
+    def test_search_repositories_invalid_limit(self, client):
         """Test repository search with invalid limit."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             json={"query": "python", "limit": -1}
         )
 
         assert response.status_code == 422
 
-    def test_search_repositories_large_limit(self):
+    def test_search_repositories_large_limit(self, client):
         """Test repository search with large limit."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             json={"query": "python", "limit": 1000}
         )
 
         assert response.status_code == 422
 
-    def test_search_repositories_default_limit(self):
+    def test_search_repositories_default_limit(self, client):
         """Test repository search with default limit."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.search_repositories.return_value = Mock(
-                repositories=[],
-                total_count=0,
-                page=1
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/search/repositories",
-                json={"query": "python"}
-            )
+        response = client.post(
+            "/api/search/repositories",
+            content=_SEARCH_DEFAULT,
+            headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total_count"] == 0
+        assert response.status_code == 200
+        assert response.json()["total_count"] == 0
 
-    @patch('src.api.search.get_github_service')
-    def test_search_repositories_service_error(self, mock_get_service):
+    def test_search_repositories_service_error(self, client, mock_gh):
         """Test repository search with service error."""
-        mock_service = Mock()
-        mock_service.search_repositories.side_effect = ValueError("GitHub API error")
-        mock_get_service.return_value = mock_service
+        mock_gh.search_repositories.side_effect = ValueError("GitHub API error")
 
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
-            json={"query": "python", "limit": 10}
+            content=_SEARCH_PYTHON,
+            headers=_JSON_HEADERS
         )
 
         assert response.status_code == 500
-        data = response.json()
-        assert "Search failed" in data["detail"]
+        assert "Search failed" in response.json()["detail"]
 
-    def test_search_repositories_invalid_json(self):
+    def test_search_repositories_invalid_json(self, client):
         """Test repository search with invalid JSON."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             data="invalid json",
             headers={"Content-Type": "application/json"}
@@ -162,42 +143,23 @@ class TestSearchAPI:
 
         assert response.status_code == 422
 
-    def test_search_repositories_wrong_method(self):
+    def test_search_repositories_wrong_method(self, client):
         """Test repository search with wrong HTTP method."""
-        response = self.client.get("/api/search/repositories")
+        response = client.get("/api/search/repositories")
         assert response.status_code == 405
 
-    @patch('src.api.search.get_github_service')
-    def test_validate_url_success(self, mock_get_service):
+    def test_validate_url_success(self, client, mock_gh, repo_info):
         """Test successful URL validation."""
-        mock_service = Mock()
-        mock_service.validate_repository_url.return_value = Mock(
+        mock_gh.validate_repository_url.return_value = SimpleNamespace(
             valid=True,
             message="Repository is valid and accessible",
-            repository_info=Mock(
-                id="12345",
-                name="test-repo",
-                full_name="owner/test-repo",
-                description="A test repository",
-                url="https://github.com/owner/test-repo",
-                html_url="https://github.com/owner/test-repo",
-                stars=100,
-                stargazers_count=100,
-                forks=25,
-                language="Python",
-                topics=["python", "test"],
-                owner="owner",
-                default_branch="main",
-                size=1024,
-                updated_at="2023-01-01T00:00:00Z",
-                created_at="2022-01-01T00:00:00Z"
-            )
+            repository_info=repo_info
         )
-        mock_get_service.return_value = mock_service
 
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
-            json={"url": "https://github.com/owner/test-repo"}
+            content=_VALIDATE_OK,
+            headers=_JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -206,36 +168,33 @@ class TestSearchAPI:
         assert "Repository is valid" in data["message"]
         assert "repository" in data
 
-    def test_validate_url_missing_url(self):
+    def test_validate_url_missing_url(self, client):
         """Test URL validation with missing URL."""
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
             json={}
         )
 
         assert response.status_code == 422
 
-    def test_validate_url_invalid_url(self):
+    def test_validate_url_invalid_url(self, client):
         """Test URL validation with invalid URL."""
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
             json={"url": "not-a-url"}
         )
 
         assert response.status_code == 422
 
-    @patch('src.api.search.get_github_service')
-    def test_validate_url_invalid_repository(self, mock_get_service):
+    def test_validate_url_invalid_repository(self, client, mock_gh):
         """Test URL validation with invalid repository."""
-        mock_service = Mock()
-        mock_service.validate_repository_url.return_value = Mock(
+        mock_gh.validate_repository_url.return_value = SimpleNamespace(
             valid=False,
             message="Repository not found or not accessible",
             repository_info=None
         )
-        mock_get_service.return_value = mock_service
 
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
             json={"url": "https://github.com/owner/nonexistent"}
         )
@@ -245,168 +204,86 @@ class TestSearchAPI:
         assert data["is_valid"] is False
         assert "not found" in data["message"].lower()
 
-    @patch('src.api.search.get_github_service')
-    def test_validate_url_service_error(self, mock_get_service):
+    def test_validate_url_service_error(self, client, mock_gh):
         """Test URL validation with service error."""
-        mock_service = Mock()
-        mock_service.validate_repository_url.side_effect = Exception("Network error")
-        mock_get_service.return_value = mock_service
+        mock_gh.validate_repository_url.side_effect = Exception("Network error")
 
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
-            json={"url": "https://github.com/owner/test-repo"}
+            content=_VALIDATE_OK,
+            headers=_JSON_HEADERS
         )
 
         assert response.status_code == 500
-        data = response.json()
-        assert "Validation failed" in data["detail"]
+        assert "Validation failed" in response.json()["detail"]
 
-    def test_validate_url_wrong_method(self):
+    def test_validate_url_wrong_method(self, client):
         """Test URL validation with wrong HTTP method."""
-        response = self.client.get("/api/validate/url")
+        response = client.get("/api/validate/url")
         assert response.status_code == 405
 
-    def test_search_repositories_content_type(self):
-        """Test repository search content type."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.search_repositories.return_value = Mock(
-                repositories=[],
-                total_count=0,
-                page=1
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/search/repositories",
-                json={"query": "python"}
-            )
-
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-
-    def test_validate_url_content_type(self):
-        """Test URL validation content type."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.validate_repository_url.return_value = Mock(
-                valid=False,
-                message="Invalid URL",
-                repository_info=None
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/validate/url",
-                json={"url": "invalid-url"}
-            )
+    @pytest.mark.asyncio
+    async def test_content_type_and_cors_headers(self, aclient, mock_gh):
+        """Test search and validation return JSON with CORS headers."""
+        mock_gh.validate_repository_url.return_value = SimpleNamespace(
+            valid=False,
+            message="Invalid URL",
+            repository_info=None
+        )
+        headers = {**_JSON_HEADERS, "Origin": "http://localhost:3000"}
+
+        # Header-only checks run concurrently on the shared async client
+        responses = await asyncio.gather(
+            aclient.post(
+                "/api/search/repositories", content=_SEARCH_DEFAULT, headers=headers
+            ),
+            aclient.post("/api/validate/url", content=_VALIDATE_OK, headers=headers),
+        )
 
+        for response in responses:
             assert response.status_code == 200
             assert response.headers["content-type"] == "application/json"
-
-    def test_search_repositories_cors_headers(self):
-        """Test repository search CORS headers."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.search_repositories.return_value = Mock(
-                repositories=[],
-                total_count=0,
-                page=1
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/search/repositories",
-                json={"query": "python"}
-            )
-
-            assert response.status_code == 200
-            assert "access-control-allow-origin" in response.headers
-
-    def test_validate_url_cors_headers(self):
-        """Test URL validation CORS headers."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            mock_service = Mock()
-            mock_service.validate_repository_url.return_value = Mock(
-                valid=False,
-                message="Invalid URL",
-                repository_info=None
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/validate/url",
-                json={"url": "invalid-url"}
-            )
-
-            assert response.status_code == 200
             assert "access-control-allow-origin" in response.headers
 
-    def test_search_repositories_large_response(self):
+    def test_search_repositories_large_response(self, client, mock_gh, large_repos):
         """Test repository search with large response."""
-        with patch('src.api.search.get_github_service') as mock_get_service:
-            # Create mock repositories
-            mock_repos = []
-            for i in range(100):
-                mock_repo = Mock(
-                    id=str(i),
-                    name=f"repo-{i}",
-                    full_name=f"owner/repo-{i}",
-                    description=f"Description {i}",
-                    url=f"https://github.com/owner/repo-{i}",
-                    html_url=f"https://github.com/owner/repo-{i}",
-                    stars=i * 10,
-                    stargazers_count=i * 10,
-                    forks=i * 2,
-                    language="Python",
-                    topics=[],
-                    owner="owner",
-                    default_branch="main",
-                    size=1024,
-                    updated_at="2023-01-01T00:00:00Z",
-                    created_at="2022-01-01T00:00:00Z"
-                )
-                mock_repos.append(mock_repo)
-
-            mock_service = Mock()
-            mock_service.search_repositories.return_value = Mock(
-                repositories=mock_repos,
-                total_count=100,
-                page=1
-            )
-            mock_get_service.return_value = mock_service
-
-            response = self.client.post(
-                "/api/search/repositories",
-                json={"query": "python", "limit": 100}
-            )
+        mock_gh.search_repositories.return_value = SimpleNamespace(
+            repositories=large_repos,
+            total_count=100,
+            page=1
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data["repositories"]) == 100
-            assert data["total_count"] == 100
+        response = client.post(
+            "/api/search/repositories",
+            json={"query": "python", "limit": 100}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["repositories"]) == 100
+        assert data["total_count"] == 100
 
-    def test_search_repositories_empty_query(self):
+    def test_search_repositories_empty_query(self, client):
         """Test repository search with empty query string."""
-        response = self.client.post(
+        response = client.post(
             "/api/search/repositories",
             json={"query": "   ", "limit": 10}
         )
 
         assert response.status_code == 422
 
-    def test_validate_url_empty_url(self):
+    def test_validate_url_empty_url(self, client):
         """Test URL validation with empty URL."""
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
             json={"url": ""}
         )
 
         assert response.status_code == 422
 
-    def test_validate_url_whitespace_url(self):
+    def test_validate_url_whitespace_url(self, client):
         """Test URL validation with whitespace URL."""
-        response = self.client.post(
+        response = client.post(
             "/api/validate/url",
             json={"url": "   "}
         )
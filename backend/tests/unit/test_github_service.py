@@ -1,48 +1,64 @@
 """Unit tests for GitHub service."""
+import copy
+from unittest.mock import Mock, patch
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from github import GithubException
 
-from src.services.github_service import GitHubService
 from src.models.repository import (
+    Repository,
+    RepositoryBase,
     RepositorySearchRequest,
     RepositoryValidationRequest,
-    RepositoryBase,
-    Repository,
 )
+from src.services.github_service import GitHubService
+
+
+@pytest.fixture(scope="session")
+def mock_repo_template():
+    """PyGithub repository mock with every attribute the service reads, built once."""
+    repo = Mock()
+    repo.id = 12345
+    repo.name = "test-repo"
+    repo.full_name = "owner/test-repo"
+    repo.description = "A test repository"
+    repo.html_url = "https://github.com/owner/test-repo"
+    repo.stargazers_count = 100
+    repo.forks_count = 25
+    repo.language = "Python"
+    repo.owner.login = "owner"
+    repo.default_branch = "main"
+    repo.size = 1024
+    repo.updated_at = "2023-01-01T00:00:00Z"
+    repo.created_at = "2022-01-01T00:00:00Z"
+    repo.clone_url = "https://github.com/owner/test-repo.git"
+    repo.ssh_url = "git@github.com:owner/test-repo.git"
+    repo.open_issues_count = 5
+    repo.watchers_count = 50
+    repo.license = Mock()
+    repo.license.name = "MIT"
+    repo.private = False
+    repo.fork = False
+    repo.has_wiki = True
+    repo.has_issues = True
+    return repo
+
+
+@pytest.fixture
+def mock_repo(mock_repo_template):
+    """Shallow copy of the template so tests may reassign top-level attributes."""
+    return copy.copy(mock_repo_template)
+
+
+@pytest.fixture
+def github_service():
+    """GitHubService without a token."""
+    return GitHubService()
 
 
 class TestGitHubService:
     """Test cases for GitHubService."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.github_service = GitHubService()
-        self.mock_repo = Mock()
-        self.mock_repo.id = 12345
-        self.mock_repo.name = "test-repo"
-        self.mock_repo.full_name = "owner/test-repo"
-        self.mock_repo.description = "A test repository"
-        self.mock_repo.html_url = "https://github.com/owner/test-repo"
-        self.mock_repo.stargazers_count = 100
-        self.mock_repo.forks_count = 25
-        self.mock_repo.language = "Python"
-        self.mock_repo.owner.login = "owner"
-        self.mock_repo.default_branch = "main"
-        self.mock_repo.size = 1024
-        self.mock_repo.updated_at = "2023-01-01T00:00:00Z"
-        self.mock_repo.created_at = "2022-01-01T00:00:00Z"
-        self.mock_repo.clone_url = "https://github.com/owner/test-repo.git"
-        self.mock_repo.ssh_url = "git@github.com:owner/test-repo.git"
-        self.mock_repo.open_issues_count = 5
-        self.mock_repo.watchers_count = 50
-        self.mock_repo.license = Mock()
-        self.mock_repo.license.name = "MIT"
-        self.mock_repo.private = False
-        self.mock_repo.fork = False
-        self.mock_repo.has_wiki = True
-        self.mock_repo.has_issues = True
-
     @patch('src.services.github_service.Github')
     def test_init_with_token(self, mock_github):
         """Test initialization with GitHub token."""
@@ -59,7 +75,7 @@ class TestGitHubService:
         assert service.github_token is None
 
     @patch('src.services.github_service.Github')
-    def test_search_repositories_success(self, mock_github):
+    def test_search_repositories_success(self, mock_github, mock_repo):
         """Test successful repository search."""
         # Setup
         mock_github_instance = Mock()
@@ -67,7 +83,7 @@ class TestGitHubService:
         
         mock_search_result = Mock()
         mock_search_result.totalCount = 1
-        mock_search_result.__iter__ = Mock(return_value=iter([self.mock_repo]))
+        mock_search_result.__iter__ = Mock(return_value=iter([mock_repo]))
         mock_github_instance.search_repositories.return_value = mock_search_result
 
         service = GitHubService()
@@ -84,7 +100,7 @@ class TestGitHubService:
         assert result.repositories[0].full_name == "owner/test-repo"
 
     @patch('src.services.github_service.Github')
-    def test_search_repositories_with_limit(self, mock_github):
+    def test_search_repositories_with_limit(self, mock_github, mock_repo):
         """Test repository search with limit."""
         # Setup
         mock_github_instance = Mock()
@@ -92,7 +108,7 @@ class TestGitHubService:
         
         mock_search_result = Mock()
         mock_search_result.totalCount = 5
-        mock_search_result.__iter__ = Mock(return_value=iter([self.mock_repo] * 5))
+        mock_search_result.__iter__ = Mock(return_value=iter([mock_repo] * 5))
         mock_github_instance.search_repositories.return_value = mock_search_result
 
         service = GitHubService()
@@ -138,12 +154,12 @@ class TestGitHubService:
             service.search_repositories(request)
 
     @patch('src.services.github_service.Github')
-    def test_validate_repository_url_valid(self, mock_github):
+    def test_validate_repository_url_valid(self, mock_github, mock_repo):
         """Test valid repository URL validation."""
         # Setup
         mock_github_instance = Mock()
         mock_github.return_value = mock_github_instance
-        mock_github_instance.get_repo.return_value = self.mock_repo
+        mock_github_instance.get_repo.return_value = mock_repo
 
         service = GitHubService()
         request = RepositoryValidationRequest(url="https://github.com/owner/test-repo")
@@ -240,12 +256,12 @@ class TestGitHubService:
         assert "Validation error" in result.message
 
     @patch('src.services.github_service.Github')
-    def test_get_repository_success(self, mock_github):
+    def test_get_repository_success(self, mock_github, mock_repo):
         """Test successful repository retrieval."""
         # Setup
         mock_github_instance = Mock()
         mock_github.return_value = mock_github_instance
-        mock_github_instance.get_repo.return_value = self.mock_repo
+        mock_github_instance.get_repo.return_value = mock_repo
 
         service = GitHubService()
 
@@ -292,44 +308,44 @@ class TestGitHubService:
         # Verify
         assert result is None
 
-    def test_get_repository_by_url_valid(self):
+    def test_get_repository_by_url_valid(self, github_service):
         """Test getting repository by valid URL."""
-        with patch.object(self.github_service, 'get_repository') as mock_get_repo:
+        with patch.object(github_service, 'get_repository') as mock_get_repo:
             mock_get_repo.return_value = Mock()
             
-            result = self.github_service.get_repository_by_url("https://github.com/owner/test-repo")
+            result = github_service.get_repository_by_url("https://github.com/owner/test-repo")
             
             mock_get_repo.assert_called_once_with("owner/test-repo")
             assert result is not None
 
-    def test_get_repository_by_url_invalid(self):
+    def test_get_repository_by_url_invalid(self, github_service):
         """Test getting repository by invalid URL."""
-        result = self.github_service.get_repository_by_url("https://gitlab.com/owner/repo")
+        result = github_service.get_repository_by_url("https://gitlab.com/owner/repo")
         assert result is None
 
     @patch('src.services.github_service.git')
-    def test_clone_repository_success(self, mock_git):
+    def test_clone_repository_success(self, mock_git, github_service):
         """Test successful repository cloning."""
         mock_repo = Mock()
         mock_git.Repo.clone_from.return_value = mock_repo
 
-        result = self.github_service.clone_repository("https://github.com/owner/repo", "/tmp/repo")
+        result = github_service.clone_repository("https://github.com/owner/repo", "/tmp/repo")
 
         assert result is True
         mock_git.Repo.clone_from.assert_called_once_with("https://github.com/owner/repo", "/tmp/repo")
 
     @patch('src.services.github_service.git')
-    def test_clone_repository_failure(self, mock_git):
+    def test_clone_repository_failure(self, mock_git, github_service):
         """Test repository cloning failure."""
         mock_git.Repo.clone_from.side_effect = Exception("Clone failed")
 
-        result = self.github_service.clone_repository("https://github.com/owner/repo", "/tmp/repo")
+        result = github_service.clone_repository("https://github.com/owner/repo", "/tmp/repo")
 
         assert result is False
 
-    def test_convert_to_repository_base(self):
+    def test_convert_to_repository_base(self, mock_repo, github_service):
         """Test conversion to RepositoryBase model."""
-        result = self.github_service._convert_to_repository_base(self.mock_repo)
+        result = github_service._convert_to_repository_base(mock_repo)
 
         assert isinstance(result, RepositoryBase)
         assert result.id == "12345"
@@ -340,9 +356,9 @@ class TestGitHubService:
         assert result.language == "Python"
         assert result.owner == "owner"
 
-    def test_convert_to_repository(self):
+    def test_convert_to_repository(self, mock_repo, github_service):
         """Test conversion to full Repository model."""
-        result = self.github_service._convert_to_repository(self.mock_repo)
+        result = github_service._convert_to_repository(mock_repo)
 
         assert isinstance(result, Repository)
         assert result.name == "test-repo"
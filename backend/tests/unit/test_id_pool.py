@@ -0,0 +1,57 @@
+"""Unit tests for pooled ID generation."""
+import os
+import uuid
+
+import pytest
+
+from src.services.id_pool import IdPool, new_id
+
+
+class TestIdPool:
+    """Test cases for IdPool."""
+
+    def test_next_returns_version4_uuid(self):
+        """Test that generated ids are valid random UUIDs."""
+        pool = IdPool(batch_size=4)
+
+        value = pool.next()
+
+        assert isinstance(value, uuid.UUID)
+        assert value.version == 4
+        assert value.variant == uuid.RFC_4122
+
+    def test_next_refills_after_batch(self):
+        """Test that ids stay unique across buffer refills."""
+        pool = IdPool(batch_size=4)
+
+        ids = {pool.next() for _ in range(10)}
+
+        assert len(ids) == 10
+
+    def test_new_id_returns_string(self):
+        """Test that new_id matches str(uuid.uuid4()) format."""
+        value = new_id()
+
+        assert isinstance(value, str)
+        assert str(uuid.UUID(value)) == value
+        assert new_id() != value
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_parent_buffer(self):
+        """Test that a forked child draws fresh entropy instead of the parent's."""
+        pool = IdPool(batch_size=4)
+        pool.next()  # fill the buffer so the parent has unused prefetched ids
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, pool.next().bytes)
+            os._exit(0)
+
+        os.close(write_fd)
+        child_id = uuid.UUID(bytes=os.read(read_fd, 16))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_id != pool.next()
@@ -1,18 +1,15 @@
 """Unit tests for Indexer service."""
-import pytest
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-from datetime import datetime
+from unittest.mock import patch
 
-from src.services.indexer_service import IndexerService
 from src.models.index import (
-    IndexStartRequest,
+    FileIndexEntry,
     IndexingStatus,
     IndexProgressInfo,
-    IndexStats,
-    FileIndexEntry,
+    IndexStartRequest,
 )
+from src.services.indexer_service import IndexerService
 
 
 class TestIndexerService:
@@ -1,7 +1,8 @@
 """Unit tests for WebSocket functionality."""
-import pytest
 import json
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch
+
+import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app